@@ -1,35 +1,142 @@
-import contextlib
+import hashlib
+import heapq
 from collections import namedtuple
-from collections.abc import Iterable
-from typing import TYPE_CHECKING, List, Type, Union
+from collections.abc import Iterable, KeysView
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+from urllib.parse import quote
 
 import django
-from django.apps import apps
+from django.apps import AppConfig, apps
 from django.conf import settings
 from django.contrib import admin
 from django.contrib.admin.apps import AdminConfig
+from django.core import checks
 from django.core.exceptions import ImproperlyConfigured
-from django.urls import NoReverseMatch, include, path, reverse
-from django.views import View
-
+from django.urls import (
+    NoReverseMatch,
+    URLResolver,
+    get_resolver,
+    get_script_prefix,
+    get_urlconf,
+    reverse,
+)
+from django.utils.http import RFC3986_SUBDELIMS
+
+from django_custom_admin_pages.app_settings import app_settings
+from django_custom_admin_pages.cache import get_menu_cache, get_menu_cache_key
 from django_custom_admin_pages.exceptions import CustomAdminImportException
-from django_custom_admin_pages.urls import add_view_to_conf
+from django_custom_admin_pages.instrumentation import MENU, measure
+from django_custom_admin_pages.registry import ViewRegistry
+from django_custom_admin_pages.urls import build_urlpatterns, set_view_defaults
 
 if TYPE_CHECKING:
     from .views.admin_base_view import AdminBaseView
+    from .views.lazy_admin_view import LazyAdminView
+
+
+MenuEntry = namedtuple("MenuEntry", ["view", "model_dict"])
+AppMenu = namedtuple("AppMenu", ["app_label", "name", "app_url", "entries"])
+MenuIndex = namedtuple("MenuIndex", ["apps", "permissions", "version"])
+
+# characters that reverse() leaves unquoted in url paths
+MENU_URL_SAFE = RFC3986_SUBDELIMS + "/~:@"
 
 
-ViewRegister = namedtuple("ViewRegister", ["app_label", "view"])
+_installed_app_index = (None, MappingProxyType({}))
+
+
+def get_installed_app_index() -> Mapping[str, AppConfig]:
+    """
+    Returns installed AppConfigs by app name and label. Built once and rebuilt when the
+    app registry is repopulated (apps.set_installed_apps/unset_installed_apps replace
+    apps.app_configs and call apps.clear_cache, e.g. with override_settings).
+    """
+    global _installed_app_index  # pylint: disable=global-statement
 
+    app_configs, index = _installed_app_index
+    if app_configs is not apps.app_configs:
+        app_configs = apps.app_configs
+        index = {}
+        for app_config in apps.get_app_configs():
+            index[app_config.label] = app_config
+            index.setdefault(app_config.name, app_config)
+        index = MappingProxyType(index)
+        _installed_app_index = (app_configs, index)
+    return index
 
-def get_installed_apps():
-    installed_apps = [app_config.name for app_config in apps.get_app_configs()]
-    return installed_apps
 
+def get_installed_apps() -> KeysView:
+    "returns names and labels of installed apps"
+    return get_installed_app_index().keys()
 
-def get_app_label(view: View) -> str:
-    "returns app label or default app for view"
-    return getattr(view, "app_label") or settings.CUSTOM_ADMIN_DEFAULT_APP_LABEL
+
+def model_sort_key(model: dict) -> str:
+    "sort key of models in an app, matches AdminSite.get_app_list"
+    return model["name"]
+
+
+def app_sort_key(app: dict) -> str:
+    "sort key of apps in the app_list, matches AdminSite.get_app_list"
+    return app["name"].lower()
+
+
+def merge_sorted(sorted_list: list, other: list, key: Callable) -> list:
+    """
+    Merges two lists already sorted by key in linear time.
+    """
+    if not other:
+        return sorted_list
+    return list(heapq.merge(sorted_list, other, key=key))
+
+
+def get_url_names(urlpatterns: Iterable) -> Set[str]:
+    "returns the names of urlpatterns and their includes"
+    names = set()
+    for pattern in urlpatterns:
+        if isinstance(pattern, URLResolver):
+            names.update(get_url_names(pattern.url_patterns))
+        elif pattern.name:
+            names.add(pattern.name)
+    return names
+
+
+_backends_resolve_permissions: Dict[Tuple[str, ...], bool] = {}
+
+
+def backends_resolve_permissions() -> bool:
+    """
+    Returns whether every authentication backend derives has_perm from
+    get_all_permissions, as ModelBackend does, so a user's permissions can be resolved
+    with user.get_all_permissions(). Computed once per AUTHENTICATION_BACKENDS.
+    """
+    from django.contrib.auth import get_backends
+    from django.contrib.auth.backends import BaseBackend, ModelBackend
+
+    backend_paths = tuple(settings.AUTHENTICATION_BACKENDS)
+    if backend_paths not in _backends_resolve_permissions:
+        _backends_resolve_permissions[backend_paths] = all(
+            getattr(type(backend), "has_perm", None)
+            in (BaseBackend.has_perm, ModelBackend.has_perm)
+            or not (
+                hasattr(backend, "has_perm") or hasattr(backend, "get_all_permissions")
+            )
+            for backend in get_backends()
+        )
+    return _backends_resolve_permissions[backend_paths]
 
 
 class CustomAdminConfig(AdminConfig):
@@ -47,8 +154,15 @@ class CustomAdminSite(admin.AdminSite):
     """
 
     def __init__(self, *args, **kwargs):
-        self._view_registry: List["AdminBaseView"] = []
+        self._view_registry = ViewRegistry()
+        self._menu_indexes: Dict[Tuple[Optional[str], str], MenuIndex] = {}
+        self._urlconf_views: FrozenSet[Type["AdminBaseView"]] = frozenset()
+        self._frozen_urlpatterns: Optional[Tuple[URLResolver, ...]] = None
         super().__init__(*args, **kwargs)
+        if app_settings.CUSTOM_ADMIN_INSTRUMENTATION:
+            from .views.performance_view import PerformanceView
+
+            self.register_view(PerformanceView)
 
     def get_urls(self):
         """
@@ -57,20 +171,55 @@ class CustomAdminSite(admin.AdminSite):
         :return: url list
         :rtype: list[path]
         """
-        urls = super().get_urls()
-        with contextlib.suppress(ImportError):
-            from .urls import urlpatterns
+        self._urlconf_views = frozenset(self._view_registry)
+        self._menu_indexes.clear()
+        if self._frozen_urlpatterns is not None:
+            return list(self._frozen_urlpatterns) + super().get_urls()
+        return build_urlpatterns(self._view_registry) + super().get_urls()
 
-            if len(urlpatterns) > 0:
-                my_urls = [
-                    path(
-                        "",
-                        include("django_custom_admin_pages.urls"),
-                    )
-                ]
-                urls = my_urls + urls
+    @property
+    def is_frozen(self) -> bool:
+        return self._frozen_urlpatterns is not None
 
-        return urls
+    def freeze(self):
+        """
+        Makes the registered views read only and builds their url patterns and menu
+        once. Call it before forking worker processes, e.g. in wsgi.py with gunicorn's
+        preload_app, so that workers share them instead of building their own.
+        """
+        if self.is_frozen:
+            return
+        # loads the root url conf, which may register views, and calls get_urls
+        get_resolver().url_patterns  # pylint: disable=expression-not-assigned
+        registry = self._view_registry.copy()
+        registry.freeze()
+        urlpatterns = tuple(build_urlpatterns(registry))
+        unfrozen_registry, self._view_registry = self._view_registry, registry
+        try:
+            self._get_menu_index()
+        except NoReverseMatch:
+            pass  # the site isn't in the root url conf
+        except Exception:
+            self._view_registry = unfrozen_registry
+            self._menu_indexes.clear()
+            raise
+        self._frozen_urlpatterns = urlpatterns
+
+    def unfreeze(self):
+        """
+        Allows views to be registered and unregistered again after freeze().
+        """
+        if not self.is_frozen:
+            return
+        self._view_registry = self._view_registry.copy()
+        self._frozen_urlpatterns = None
+        self._menu_indexes.clear()
+
+    def _check_not_frozen(self):
+        if self.is_frozen:
+            raise ImproperlyConfigured(
+                f"Views can't be registered or unregistered after the {self.name} admin site is frozen."
+            )
 
     def register_view(self, view_or_iterable: Union[Iterable, "AdminBaseView"]):
         """
@@ -78,12 +227,14 @@ class CustomAdminSite(admin.AdminSite):
 
         :param view_or_iterable: iterable of views or view
         :type view_or_iterable: iterable[View] or View
-        :raise admin.sites.AlreadyRegistered: If view is already registered.
+        :raise admin.sites.AlreadyRegistered: If view or its route_name is already registered.
         :return: None
         :rtype: None
         """
         from .views.admin_base_view import AdminBaseView
+        from .views.async_admin_base_view import AsyncAdminBaseView
 
+        self._check_not_frozen()
         if not isinstance(view_or_iterable, Iterable):
             view_or_iterable = [view_or_iterable]
 
@@ -107,6 +258,17 @@ class CustomAdminSite(admin.AdminSite):
                     "View must have name attribute set as string."
                 )
 
+            if issubclass(view, AsyncAdminBaseView):
+                if django.VERSION < (4, 1):
+                    raise ImproperlyConfigured(
+                        f"Your view {view.view_name} is async, async views require Django 4.1 or later."
+                    )
+                # raises ImproperlyConfigured if sync and async handlers are mixed
+                if not view.view_is_async:
+                    raise ImproperlyConfigured(
+                        f"Your view {view.view_name} inherits from AsyncAdminBaseView but has no async handlers."
+                    )
+
             if app_label := getattr(view, "app_label", None):
                 if not app_label in get_installed_apps():
                     raise ImproperlyConfigured(
@@ -118,9 +280,48 @@ class CustomAdminSite(admin.AdminSite):
                     f"View: {str(view.view_name)} is already registered."
                 )
 
-            self._view_registry.append(view)
+            set_view_defaults(view)
+            self._view_registry.add(view)
+            self._menu_indexes.clear()
+            self.register_view(view.get_extra_views())
+
+    def register_lazy_view(  # pylint: disable=too-many-arguments
+        self,
+        view_path: str,
+        view_name: str,
+        app_label: Optional[str] = None,
+        route_name: Optional[str] = None,
+        route_path: Optional[str] = None,
+        permission_required: "Union[str, Iterable[str]]" = (),
+    ) -> Type["LazyAdminView"]:
+        """
+        Registers the view at view_path without importing it. The view is imported
+        when it's first dispatched, its menu entry and url are built from the given
+        attributes, which should match the view's.
 
-            add_view_to_conf(view)
+        :param view_path: dotted path of a view inheriting from AdminBaseView
+        :return: the registered stand-in view, used to unregister it
+        """
+        from .views.lazy_admin_view import make_lazy_view
+
+        view = make_lazy_view(
+            view_path,
+            view_name,
+            app_label=app_label,
+            route_name=route_name,
+            route_path=route_path,
+            permission_required=permission_required,
+        )
+        self.register_view(view)
+        return view
+
+    def register_view_manifest(self, manifest: "Iterable[Dict[str, Any]]"):
+        """
+        Lazily registers the views of a manifest, a list of dicts with the arguments
+        of register_lazy_view such as settings.CUSTOM_ADMIN_VIEWS.
+        """
+        for entry in manifest:
+            self.register_lazy_view(**entry)
 
     def unregister_view(self, view_or_iterable: Union[Iterable, Type]):
         """
@@ -132,120 +333,308 @@ class CustomAdminSite(admin.AdminSite):
         :return: None
         :rtype: None
         """
-
-        def _raise_not_registered(view, e=None):
-            msg = f"The view {view.__name__} is not registered"
-            if e:
-                raise admin.sites.NotRegistered(msg) from e
-            raise admin.sites.NotRegistered(msg)
-
+        self._check_not_frozen()
         if not isinstance(view_or_iterable, Iterable):
             view_or_iterable = [view_or_iterable]
 
-        original_length = len(self._view_registry)
-
         for view in view_or_iterable:
+            self._view_registry.remove(view)
+            self._menu_indexes.clear()
+            self.unregister_view(view.get_extra_views())
+
+    def is_view_registered(self, view: Type["AdminBaseView"]) -> bool:
+        """
+        Check if a view is registered with the CustomAdminSite.
+        """
+        return view in self._view_registry
+
+    def get_registered_views(self) -> Tuple[Type["AdminBaseView"], ...]:
+        """
+        Returns the registered views in registration order.
+        """
+        return tuple(self._view_registry)
+
+    def get_registered_view(self, route_name: str) -> Type["AdminBaseView"]:
+        """
+        Returns the registered view with the given route_name.
+
+        :raise admin.sites.NotRegistered: If no view is registered with route_name.
+        """
+        view = self._view_registry.get_by_route_name(route_name)
+        if view is None:
+            raise admin.sites.NotRegistered(
+                f"No view is registered with route_name {route_name}"
+            )
+        return view
+
+    def check_views(self) -> List[checks.CheckMessage]:
+        """
+        Validates registered views. Run once at startup by the
+        django_custom_admin_pages system checks instead of on every request.
+        """
+        from .views.admin_base_view import AdminBaseView
+
+        errors = []
+        installed_apps = get_installed_app_index()
+        admin_url_names = get_url_names(super().get_urls())
+
+        for view in self._view_registry:
+            if (
+                view.app_label != app_settings.CUSTOM_ADMIN_DEFAULT_APP_LABEL
+                and view.app_label not in installed_apps
+            ):
+                errors.append(
+                    checks.Error(
+                        f"The app_label '{view.app_label}' of {view.__name__} is not in settings.INSTALLED_APPS.",
+                        obj=view,
+                        id="django_custom_admin_pages.E001",
+                    )
+                )
+
+            if view.route_name in admin_url_names:
+                errors.append(
+                    checks.Error(
+                        f"The route_name '{view.route_name}' of {view.__name__} clashes with a url name of the {self.name} admin site.",
+                        hint="Set route_name on the view to a unique name.",
+                        obj=view,
+                        id="django_custom_admin_pages.E002",
+                    )
+                )
+
             try:
-                self._view_registry.remove(view)
+                perms = AdminBaseView.normalize_permission_required(
+                    view.permission_required
+                )
             except ValueError as e:
-                _raise_not_registered(view, e)
+                perms = ()
+                errors.append(
+                    checks.Error(str(e), obj=view, id="django_custom_admin_pages.E003")
+                )
+            for perm in perms:
+                if not isinstance(perm, str) or perm.count(".") != 1:
+                    errors.append(
+                        checks.Error(
+                            f"The permission '{perm}' of {view.__name__} must be in the format 'app_label.codename'.",
+                            obj=view,
+                            id="django_custom_admin_pages.E003",
+                        )
+                    )
 
-            if len(self._view_registry) == original_length:
-                _raise_not_registered(view)
+            if view.show_in_menu and "<" in view.route_path:
+                errors.append(
+                    checks.Warning(
+                        f"The route_path '{view.route_path}' of {view.__name__} has path converters, so its admin menu link won't resolve.",
+                        obj=view,
+                        id="django_custom_admin_pages.W001",
+                    )
+                )
 
-    def _build_modelview(self, view) -> dict:
+        return errors
+
+    def _build_modelview(self, view, index_url: str) -> dict:
         """
-        Creates dict for custom admin view for use in app_list[models]
+        Creates dict for custom admin view for use in app_list[models]. The view's url
+        is built from the admin index url instead of reversing each view.
         """
-        try:
-            url = reverse(f"{self.name}:{view.route_name}")
-        except NoReverseMatch as e:
+        if view not in self._urlconf_views:
             message = (
                 f"Cannot find CustomAdminView: {view.view_name}. This is most likely because the "
                 + "root url conf was loaded before the view was registered. Try importing the view at "
                 + "the top of your root url conf or placing the registration above url_patterns."
             )
-            raise CustomAdminImportException(message) from e
+            raise CustomAdminImportException(message)
         name = view.view_name
+        # quoted like reverse() quotes paths
+        view_path = quote(f"{view.app_label}/{view.route_path}", safe=MENU_URL_SAFE)
         return {
             "name": name,
             "object_name": name,
-            "admin_url": url,
+            "admin_url": f"{index_url}{view_path}",
             "view_only": True,
         }
 
+    def _get_menu_index(self) -> MenuIndex:
+        """
+        Returns the menu index of registered views for the current url conf and script
+        prefix, building it on first use after the url conf has loaded. Reset whenever
+        a view is registered or unregistered or the site's urls are regenerated.
+        """
+        cache_key = (get_urlconf(), get_script_prefix())
+        menu_index = self._menu_indexes.get(cache_key)
+        if menu_index is None:
+            menu_index = self._menu_indexes[cache_key] = self._build_menu_index()
+        return menu_index
+
+    def _build_menu_index(self) -> MenuIndex:
+        """
+        Groups registered views by app label into AppMenus holding entries sorted by
+        name with their urls already resolved, and collects every permission codename
+        the views require. Views with show_in_menu unset are left out. Only the admin
+        index url is reversed. App labels are validated by register_view and the
+        startup system checks, not here.
+        """
+        permissions = set()
+        version = hashlib.sha1()
+        for view in self._view_registry:
+            if not view.show_in_menu:
+                continue
+            view_permissions = view.normalize_permission_required(
+                view.permission_required
+            )
+            permissions.update(view_permissions)
+            version.update(repr((view.route_name, sorted(view_permissions))).encode())
+
+        index_url = reverse(f"{self.name}:index")
+        installed_apps = get_installed_app_index()
+        menu_index = {}
+        for app_label in self._view_registry.get_app_labels():
+            views = [
+                view
+                for view in self._view_registry.get_by_app_label(app_label)
+                if view.show_in_menu
+            ]
+            if not views:
+                continue
+            if app_label == app_settings.CUSTOM_ADMIN_DEFAULT_APP_LABEL:
+                name = "Custom Admin Pages"
+            elif app_label in installed_apps:
+                name = installed_apps[app_label].verbose_name
+            else:
+                name = app_label
+            entries = sorted(
+                (
+                    MenuEntry(view, self._build_modelview(view, index_url))
+                    for view in views
+                ),
+                key=lambda x: model_sort_key(x.model_dict),
+            )
+            menu_index[app_label] = AppMenu(
+                app_label, name, f"{index_url}{app_label}/", tuple(entries)
+            )
+
+        menu_index = {
+            app_menu.app_label: app_menu
+            for app_menu in sorted(menu_index.values(), key=lambda x: x.name.lower())
+        }
+        return MenuIndex(
+            MappingProxyType(menu_index), frozenset(permissions), version.hexdigest()
+        )
+
+    @staticmethod
+    def _get_user_permissions(user, permissions: FrozenSet[str]) -> Optional[Set[str]]:
+        """
+        Resolves which of the given permission codenames the user has with a single
+        call to user.get_all_permissions(). Returns None if the user's permissions
+        don't need to be looked up, or if an authentication backend implements has_perm
+        on its own and views have to check them with user.has_perms().
+        """
+        if not permissions or not user.is_active or not user.is_staff:
+            return None
+        if user.is_superuser or not backends_resolve_permissions():
+            return None
+        return permissions.intersection(user.get_all_permissions())
+
+    def _get_visible_routes(
+        self, user, menu_index: MenuIndex, app_menus: "Iterable[AppMenu]"
+    ) -> FrozenSet[str]:
+        """
+        Returns the route names of the views in app_menus the user has permission for.
+        When settings.CUSTOM_ADMIN_MENU_CACHE is set, the routes of every app are
+        resolved instead and cached across requests.
+        """
+        cache = get_menu_cache() if user.pk is not None else None
+        if cache is not None:
+            cache_key = get_menu_cache_key(cache, self.name, menu_index.version, user)
+            visible_routes = cache.get(cache_key)
+            if visible_routes is not None:
+                return visible_routes
+            app_menus = menu_index.apps.values()
+        elif not app_menus:
+            return frozenset()
+
+        user_permissions = self._get_user_permissions(user, menu_index.permissions)
+        visible_routes = frozenset(
+            entry.view.route_name
+            for app_menu in app_menus
+            for entry in app_menu.entries
+            if entry.view.user_has_class_permission(user, user_permissions)
+        )
+
+        if cache is not None:
+            cache.set(
+                cache_key, visible_routes, app_settings.CUSTOM_ADMIN_MENU_CACHE_TIMEOUT
+            )
+        return visible_routes
+
     def get_app_list(self, request, app_label=None):
         """
         Adds registered views to the app_list after generating ModelAdmin app_list.
+        The app_list is built once per request and app_label, later calls within the
+        same request (e.g. from each_context) return a copy of the first result.
 
         :param request: request
         :type request: HttpRequest
-        :raise django.core.exceptions.ImproperlyConfigured: if invalid app_label on view class attribute
         :return: app_list
         :rtype: List[Dict]
         """
-        super_kwargs = {"app_label": app_label} if django.VERSION >= (4, 1) else {}
+        app_lists = getattr(request, "_custom_admin_app_lists", None)
+        if app_lists is None:
+            app_lists = request._custom_admin_app_lists = {}
 
-        app_list = super().get_app_list(request, **super_kwargs)
-        custom_admin_models = []
+        cache_key = (self.name, app_label)
+        if cache_key not in app_lists:
+            with measure(MENU, self.name):
+                app_lists[cache_key] = self._build_app_list(request, app_label)
 
-        for view in self._view_registry:
-            found = False
-            if not view().user_has_permission(request.user):
-                # skip if no permission
-                continue
+        return [
+            {**app, "models": [dict(model) for model in app["models"]]}
+            for app in app_lists[cache_key]
+        ]
 
-            view_app_label = get_app_label(view).lower()
+    def _build_app_list(self, request, app_label=None):
+        """
+        Builds the ModelAdmin app_list and merges registered views into it. If app_label
+        is given, only views registered under that app_label are looked at.
+        """
+        super_kwargs = {"app_label": app_label} if django.VERSION >= (4, 1) else {}
 
-            if view_app_label == settings.CUSTOM_ADMIN_DEFAULT_APP_LABEL:
-                custom_admin_models.append(self._build_modelview(view))
-                # add to custom admin
+        app_list = super().get_app_list(request, **super_kwargs)
+        apps_by_label = {app.get("app_label", "").lower(): app for app in app_list}
+
+        menu_index = self._get_menu_index()
+        if app_label is None:
+            app_menus = menu_index.apps.values()
+        elif app_menu := menu_index.apps.get(app_label.lower()):
+            app_menus = [app_menu]
+        else:
+            app_menus = []
+        visible_routes = self._get_visible_routes(request.user, menu_index, app_menus)
+
+        custom_apps = []
+        for app_menu in app_menus:
+            models = [
+                entry.model_dict
+                for entry in app_menu.entries
+                if entry.view.route_name in visible_routes
+            ]
+            if not models:
+                # skip if no permission
                 continue
 
-            for app in app_list:
-                if view_app_label == app.get("app_label", "").lower():
-                    found = True
-                    app_models = app["models"]
-                    app_models.append(self._build_modelview(view))
-                    app_models.sort(key=lambda x: x["name"])
-                    # if app exists add view to models
-                    break
-
-            if not found:
-                remaining_apps = set(set(get_installed_apps())).difference(
-                    [x["app_label"] for x in app_list]
-                )
-                for app in remaining_apps:
-                    if view_app_label == app:
-                        found = True
-                        app_config = apps.get_app_config(view_app_label)
-                        app_name = app_config.verbose_name
-                        # if app doesn't exist, create it and add model.
-                        app_list.append(
-                            {
-                                "name": app_name,
-                                "app_label": view_app_label,
-                                "app_url": f"{reverse(f'{self.name}:{view.route_name}')}{view_app_label}/",
-                                "models": [self._build_modelview(view)],
-                            }
-                        )
-
-            if not found:
-                raise ImproperlyConfigured(
-                    f'The following custom admin view has an app_label that couldn\'t be found: "{view.__name__}". Please check that "{view_app_label}" is a valid app_label.'
-                )
-
-        if custom_admin_models:
-            # add the default custom admin app if any models
-            app_list += [self._build_custom_admin_app(custom_admin_models)]
+            if app := apps_by_label.get(app_menu.app_label):
+                # if app exists merge views into its models
+                app["models"] = merge_sorted(app["models"], models, model_sort_key)
+            else:
+                # if app doesn't exist, create it and add views.
+                custom_apps.append(self._build_custom_admin_app(app_menu, models))
 
-        app_list = sorted(app_list, key=lambda x: x["name"])
-        return app_list
+        # menu_index.apps are ordered by name, like the ModelAdmin app_list
+        return merge_sorted(app_list, custom_apps, app_sort_key)
 
-    def _build_custom_admin_app(self, custom_admin_models):
+    def _build_custom_admin_app(self, app_menu: AppMenu, models: List[dict]) -> dict:
         return {
-            "name": "Custom Admin Pages",
-            "app_label": settings.CUSTOM_ADMIN_DEFAULT_APP_LABEL,
-            "app_url": f"{reverse(f'{self.name}:index')}{settings.CUSTOM_ADMIN_DEFAULT_APP_LABEL}/",
-            "models": custom_admin_models,
+            "name": app_menu.name,
+            "app_label": app_menu.app_label,
+            "app_url": app_menu.app_url,
+            "models": models,
         }
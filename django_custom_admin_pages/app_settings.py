@@ -0,0 +1,57 @@
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.signals import setting_changed
+
+from . import default_settings
+
+DEFAULTS: Dict[str, Any] = {
+    name: getattr(default_settings, name)
+    for name in dir(default_settings)
+    if name.isupper()
+}
+
+
+class AppSettings:
+    """
+    The settings of django_custom_admin_pages, falling back to default_settings. Each
+    setting is read from django.conf.settings once and cached until a setting changes,
+    so request paths don't repeat lookups on the lazy settings object.
+    """
+
+    CUSTOM_ADMIN_DEFAULT_APP_LABEL: str
+    CUSTOM_ADMIN_MENU_CACHE: Optional[str]
+    CUSTOM_ADMIN_MENU_CACHE_TIMEOUT: int
+    CUSTOM_ADMIN_JOB_EXECUTOR: str
+    CUSTOM_ADMIN_JOB_CACHE: str
+    CUSTOM_ADMIN_JOB_STATUS_TIMEOUT: int
+    CUSTOM_ADMIN_VIEWS: List[Dict[str, Any]]
+    CUSTOM_ADMIN_AUTODISCOVER: bool
+    CUSTOM_ADMIN_INSTRUMENTATION: bool
+    CUSTOM_ADMIN_INSTRUMENTATION_SINKS: List[str]
+    CUSTOM_ADMIN_STATSD_HOST: str
+    CUSTOM_ADMIN_STATSD_PORT: int
+    CUSTOM_ADMIN_STATSD_PREFIX: str
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in DEFAULTS:
+            raise AttributeError(f"Invalid django_custom_admin_pages setting: {name}")
+        value = getattr(settings, name, DEFAULTS[name])
+        # cached on the instance, so __getattr__ isn't called again
+        setattr(self, name, value)
+        return value
+
+    def reload(self):
+        "clears cached settings"
+        self.__dict__.clear()
+
+
+app_settings = AppSettings()
+
+
+def reload_app_settings(*, setting: str, **kwargs):
+    if setting in DEFAULTS:
+        app_settings.reload()
+
+
+setting_changed.connect(reload_app_settings)
@@ -7,10 +7,25 @@ class DjangoCustomAdminPagesConfig(AppConfig):
     def ready(self):
         # Load default settings when the app is ready
         from django.conf import settings
+        from django.core import checks
 
-        from . import default_settings
+        from .app_settings import DEFAULTS, app_settings
+        from .checks import check_custom_admin_permissions, check_custom_admin_views
+        from .discovery import autodiscover
+        from .signals import connect_signals
 
-        for setting in dir(default_settings):
-            if not hasattr(settings, setting):
-                value = getattr(default_settings, setting)
-                setattr(settings, setting, value)
+        for name, value in DEFAULTS.items():
+            if not hasattr(settings, name):
+                setattr(settings, name, value)
+
+        if app_settings.CUSTOM_ADMIN_VIEWS:
+            from django.contrib import admin
+
+            admin.site.register_view_manifest(app_settings.CUSTOM_ADMIN_VIEWS)
+
+        if app_settings.CUSTOM_ADMIN_AUTODISCOVER:
+            autodiscover()
+
+        connect_signals()
+        checks.register(check_custom_admin_views, checks.Tags.admin)
+        checks.register(check_custom_admin_permissions, checks.Tags.database)
@@ -0,0 +1,147 @@
+import hashlib
+import time
+import uuid
+from typing import TYPE_CHECKING, Callable, Optional
+
+from django.core.cache import BaseCache, caches
+from django.utils import translation
+from django.utils.safestring import SafeString, mark_safe
+
+from .app_settings import app_settings
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractBaseUser
+
+    from .views.admin_base_view import AdminBaseView
+
+
+CACHE_KEY_PREFIX = "django_custom_admin_pages"
+PERMISSION_VERSION_KEY = f"{CACHE_KEY_PREFIX}:permission_version"
+
+
+def get_menu_cache() -> Optional[BaseCache]:
+    "returns the cache configured by CUSTOM_ADMIN_MENU_CACHE or None if disabled"
+    alias = app_settings.CUSTOM_ADMIN_MENU_CACHE
+    if alias is None:
+        return None
+    return caches[alias]
+
+
+def get_permission_version(cache: BaseCache) -> str:
+    """
+    Returns the current permission version, bumped whenever groups or permissions change.
+    """
+    return cache.get_or_set(PERMISSION_VERSION_KEY, lambda: uuid.uuid4().hex, None)
+
+
+def bump_permission_version():
+    """
+    Invalidates every cached menu by setting a new permission version.
+    A random version is used so that an evicted version can't be reused.
+    """
+    if cache := get_menu_cache():
+        cache.set(PERMISSION_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def get_menu_cache_key(
+    cache: BaseCache, site_name: str, registry_version: str, user: "AbstractBaseUser"
+) -> str:
+    """
+    Builds the cache key of a user's custom view menu. The user's active, staff and
+    superuser flags are part of the key since they change which views are visible.
+    """
+    flags = "".join(
+        str(int(bool(flag)))
+        for flag in (user.is_active, user.is_staff, user.is_superuser)
+    )
+    return ":".join(
+        [
+            CACHE_KEY_PREFIX,
+            "menu",
+            site_name,
+            registry_version,
+            get_permission_version(cache),
+            str(user.pk),
+            flags,
+        ]
+    )
+
+
+def get_permission_fingerprint(user: "AbstractBaseUser") -> str:
+    """
+    Returns a string that is equal for users who have the same permissions.
+    """
+    if not user.is_active:
+        return "inactive"
+    if user.is_superuser:
+        return "superuser"
+    perms = ",".join(sorted(user.get_all_permissions()))
+    return hashlib.sha1(f"{user.is_staff}:{perms}".encode()).hexdigest()
+
+
+def get_content_cache_key(view: "AdminBaseView") -> str:
+    """
+    Builds the cache key of a view's rendered content from the view class, url
+    arguments, query string, active language, the user's permission fingerprint and
+    the view's get_content_cache_version().
+    """
+    request = view.request
+    key_parts = [
+        f"{view.__class__.__module__}.{view.__class__.__qualname__}",
+        repr(view.args),
+        repr(sorted(view.kwargs.items())),
+        repr(sorted(request.GET.lists())),
+        translation.get_language() or "",
+        get_permission_fingerprint(request.user),
+        str(view.get_content_cache_version()),
+    ]
+    digest = hashlib.sha1("\n".join(key_parts).encode()).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:content:{digest}"
+
+
+class ContentCache:
+    """
+    Cached content of a view, looked up when the view builds its context and filled by
+    the custom_admin_cache template tag. Only one process renders missing content at
+    a time; others wait up to lock_timeout seconds for it before rendering themselves.
+    """
+
+    poll_interval = 0.05
+
+    def __init__(self, cache: BaseCache, key: str, timeout: int, lock_timeout: int):
+        self.cache = cache
+        self.key = key
+        self.timeout = timeout
+        self.lock_timeout = lock_timeout
+        self.content: Optional[str] = cache.get(key)
+
+    @classmethod
+    def for_view(cls, view: "AdminBaseView") -> "ContentCache":
+        return cls(
+            caches[view.content_cache_alias],
+            get_content_cache_key(view),
+            view.content_cache_timeout,
+            view.content_cache_lock_timeout,
+        )
+
+    def render(self, render_content: Callable[[], str]) -> SafeString:
+        if self.content is not None:
+            return mark_safe(self.content)
+
+        lock_key = f"{self.key}:lock"
+        if self.cache.add(lock_key, 1, self.lock_timeout):
+            try:
+                self.content = render_content()
+                self.cache.set(self.key, self.content, self.timeout)
+            finally:
+                self.cache.delete(lock_key)
+            return mark_safe(self.content)
+
+        # another request is rendering the content, wait for it
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            content = self.cache.get(self.key)
+            if content is not None:
+                return mark_safe(content)
+        return mark_safe(render_content())
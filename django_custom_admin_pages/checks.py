@@ -0,0 +1,104 @@
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple, Type
+
+from django.conf import settings
+from django.contrib.admin.sites import all_sites
+from django.core import checks
+from django.db import DatabaseError
+from django.db.models import Q
+from django.urls import get_resolver
+
+if TYPE_CHECKING:
+    from .views.admin_base_view import AdminBaseView
+
+
+def get_custom_admin_sites():
+    from .admin import CustomAdminSite
+
+    return [site for site in all_sites if isinstance(site, CustomAdminSite)]
+
+
+def check_custom_admin_views(**kwargs):
+    """
+    Validates the views registered on every CustomAdminSite.
+    """
+    if getattr(settings, "ROOT_URLCONF", None):
+        # views are commonly registered by imports in the root url conf
+        get_resolver().url_patterns  # pylint: disable=expression-not-assigned
+
+    errors = []
+    for site in get_custom_admin_sites():
+        errors.extend(site.check_views())
+    return errors
+
+
+def get_missing_permissions(
+    views: Iterable[Type["AdminBaseView"]], using: str
+) -> Dict[str, List[Type["AdminBaseView"]]]:
+    """
+    Returns the permissions required by views which don't exist in the database,
+    mapped to the views requiring them. Looks every permission up in one query.
+    """
+    from django.contrib.auth.models import Permission
+
+    views_by_perm = defaultdict(list)
+    for view in views:
+        try:
+            perms = view.normalize_permission_required(view.permission_required)
+        except ValueError:
+            continue  # reported by check_custom_admin_views
+        for perm in perms:
+            if isinstance(perm, str) and perm.count(".") == 1:
+                views_by_perm[perm].append(view)
+
+    if not views_by_perm:
+        return {}
+
+    declared: Dict[Tuple[str, str], str] = {
+        tuple(perm.split(".")): perm for perm in views_by_perm
+    }
+    app_labels = {app_label for app_label, _ in declared}
+    codenames = {codename for _, codename in declared}
+    existing = set(
+        Permission.objects.using(using)
+        .filter(Q(content_type__app_label__in=app_labels) & Q(codename__in=codenames))
+        .values_list("content_type__app_label", "codename")
+    )
+    return {
+        perm: views_by_perm[perm]
+        for key, perm in declared.items()
+        if key not in existing
+    }
+
+
+def check_custom_admin_permissions(databases=None, **kwargs):
+    """
+    Warns about permission_required entries of registered views which don't exist, as
+    they hide the view from every user but superusers. Only runs when databases are
+    checked, e.g. ``manage.py check --database default``.
+    """
+    if not databases:
+        return []
+
+    views = [
+        view
+        for site in get_custom_admin_sites()
+        for view in site.get_registered_views()
+    ]
+    warnings = []
+    for database in databases:
+        try:
+            missing = get_missing_permissions(views, database)
+        except DatabaseError:
+            continue  # e.g. auth isn't migrated yet
+        for perm, perm_views in missing.items():
+            warnings.extend(
+                checks.Warning(
+                    f"The permission '{perm}' required by {view.__name__} does not exist in the '{database}' database.",
+                    hint="Check the permission's app_label and codename for typos.",
+                    obj=view,
+                    id="django_custom_admin_pages.W002",
+                )
+                for view in perm_views
+            )
+    return warnings
@@ -1 +1,17 @@
 CUSTOM_ADMIN_DEFAULT_APP_LABEL = "django_custom_admin_pages"
+CUSTOM_ADMIN_MENU_CACHE = None  # cache alias for per-user custom view menus
+CUSTOM_ADMIN_MENU_CACHE_TIMEOUT = 300
+CUSTOM_ADMIN_JOB_EXECUTOR = "django_custom_admin_pages.jobs.ThreadJobExecutor"
+CUSTOM_ADMIN_JOB_CACHE = "default"  # cache alias for job statuses
+CUSTOM_ADMIN_JOB_STATUS_TIMEOUT = 86400
+# views registered lazily, see CustomAdminSite.register_view_manifest
+CUSTOM_ADMIN_VIEWS = []
+# import the admin_views module of every app on startup
+CUSTOM_ADMIN_AUTODISCOVER = False
+CUSTOM_ADMIN_INSTRUMENTATION = False  # time custom views and menus
+CUSTOM_ADMIN_INSTRUMENTATION_SINKS = [
+    "django_custom_admin_pages.instrumentation.MemorySink",
+]
+CUSTOM_ADMIN_STATSD_HOST = "127.0.0.1"
+CUSTOM_ADMIN_STATSD_PORT = 8125
+CUSTOM_ADMIN_STATSD_PREFIX = "custom_admin"
@@ -0,0 +1,32 @@
+import time
+from collections import namedtuple
+from importlib import import_module
+from typing import List
+
+from django.apps import apps
+from django.utils.module_loading import module_has_submodule
+
+ModuleTiming = namedtuple("ModuleTiming", ["app_label", "module", "seconds"])
+
+# timings of the modules imported by autodiscover, in import order
+module_timings: List[ModuleTiming] = []
+
+
+def autodiscover(module_name: str = "admin_views") -> List[ModuleTiming]:
+    """
+    Imports the module_name submodule of every installed app that has one, like
+    admin.autodiscover, and records how long each import took. The time of a module
+    includes the modules it imports that weren't imported yet.
+    """
+    timings = []
+    for app_config in apps.get_app_configs():
+        if not module_has_submodule(app_config.module, module_name):
+            continue
+        module = f"{app_config.name}.{module_name}"
+        start = time.perf_counter()
+        import_module(module)
+        timings.append(
+            ModuleTiming(app_config.label, module, time.perf_counter() - start)
+        )
+    module_timings.extend(timings)
+    return timings
@@ -0,0 +1,232 @@
+import logging
+import socket
+import threading
+import time
+from collections import namedtuple
+from contextlib import ExitStack, nullcontext
+from typing import Dict, List, Optional, Tuple
+
+from django.db import connections
+from django.dispatch import Signal
+from django.utils.module_loading import import_string
+
+from .app_settings import app_settings
+
+logger = logging.getLogger(__name__)
+
+DISPATCH = "dispatch"  # a view's response time, including template rendering
+PERMISSION = "permission"  # a view's permission check
+MENU = "menu"  # building a site's app_list
+
+# queries is None if queries weren't counted
+Timing = namedtuple("Timing", ["metric", "target", "seconds", "queries"])
+
+# sent by SignalSink with timing=Timing
+timing_recorded = Signal()
+
+
+class QueryCounter:
+    "database execute wrapper that counts queries"
+
+    def __init__(self):
+        self.count = 0
+
+    # the signature of database execute wrappers
+    def __call__(  # pylint: disable=too-many-arguments
+        self, execute, sql, params, many, context
+    ):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Measurement:
+    """
+    Records how long it ran and, if count_queries is set, how many queries it made on
+    this thread's database connections. Use it as a context manager, or call start()
+    and stop() when the measured work ends elsewhere, e.g. once a template response is
+    rendered.
+    """
+
+    def __init__(self, metric: str, target: str, count_queries: bool = True):
+        self.metric = metric
+        self.target = target
+        self.count_queries = count_queries
+        self.wrappers = None
+
+    def start(self) -> "Measurement":
+        self.queries = QueryCounter() if self.count_queries else None
+        self.wrappers = ExitStack()
+        if self.queries is not None:
+            for connection in connections.all():
+                self.wrappers.enter_context(connection.execute_wrapper(self.queries))
+        self.start_time = time.perf_counter()
+        return self
+
+    def stop(self):
+        "records the timing, only the first call after start() does"
+        if self.wrappers is None:
+            return
+        seconds = time.perf_counter() - self.start_time
+        self.wrappers.close()
+        self.wrappers = None
+        queries = self.queries.count if self.queries is not None else None
+        record(Timing(self.metric, self.target, seconds, queries))
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def measure(metric: str, target: str, count_queries: bool = True):
+    "returns a Measurement if CUSTOM_ADMIN_INSTRUMENTATION is on"
+    if not app_settings.CUSTOM_ADMIN_INSTRUMENTATION:
+        return nullcontext()
+    return Measurement(metric, target, count_queries)
+
+
+class Sink:
+    """
+    Receives recorded timings. Set CUSTOM_ADMIN_INSTRUMENTATION_SINKS to the dotted
+    paths of the sinks to use.
+    """
+
+    def emit(self, timing: Timing):
+        raise NotImplementedError("subclasses of Sink must provide emit()")
+
+
+class LoggingSink(Sink):
+    "logs timings to the django_custom_admin_pages.instrumentation logger"
+
+    def emit(self, timing):
+        if timing.queries is None:
+            logger.info(
+                "%s %s took %.1f ms",
+                timing.metric,
+                timing.target,
+                timing.seconds * 1000,
+            )
+            return
+        logger.info(
+            "%s %s took %.1f ms with %d queries",
+            timing.metric,
+            timing.target,
+            timing.seconds * 1000,
+            timing.queries,
+        )
+
+
+class SignalSink(Sink):
+    "sends the timing_recorded signal"
+
+    def emit(self, timing):
+        timing_recorded.send(sender=self.__class__, timing=timing)
+
+
+class StatsdSink(Sink):
+    """
+    Sends timings to a StatsD server over UDP, as ``<prefix>.<metric>.<target>`` timers
+    in milliseconds and ``<prefix>.<metric>.<target>.queries`` counters.
+    """
+
+    def __init__(self):
+        self.address = (
+            app_settings.CUSTOM_ADMIN_STATSD_HOST,
+            app_settings.CUSTOM_ADMIN_STATSD_PORT,
+        )
+        self.prefix = app_settings.CUSTOM_ADMIN_STATSD_PREFIX
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+
+    def format(self, timing: Timing) -> bytes:
+        target = "".join(
+            c if c.isalnum() or c in "-_" else "_" for c in str(timing.target)
+        )
+        name = f"{self.prefix}.{timing.metric}.{target}"
+        lines = [f"{name}:{timing.seconds * 1000:.3f}|ms"]
+        if timing.queries is not None:
+            lines.append(f"{name}.queries:{timing.queries}|c")
+        return "\n".join(lines).encode()
+
+    def emit(self, timing):
+        try:
+            self.socket.sendto(self.format(timing), self.address)
+        except OSError:
+            pass  # metrics are best effort
+
+
+class TimingStats(
+    namedtuple(
+        "TimingStats",
+        ["metric", "target", "count", "total_seconds", "max_seconds", "total_queries"],
+    )
+):
+    @property
+    def average_ms(self) -> float:
+        return self.total_seconds * 1000 / self.count
+
+    @property
+    def max_ms(self) -> float:
+        return self.max_seconds * 1000
+
+    @property
+    def average_queries(self) -> Optional[float]:
+        "None if queries weren't counted"
+        if self.total_queries is None:
+            return None
+        return self.total_queries / self.count
+
+
+class MemorySink(Sink):
+    """
+    Aggregates timings per metric and target in the memory of the process. Shown on
+    the custom admin performance page.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # (metric, target): [count, total_seconds, max_seconds, total_queries]
+        # total_queries stays None while no timing counted queries
+        self.stats: Dict[Tuple[str, str], list] = {}
+
+    def emit(self, timing):
+        with self.lock:
+            stats = self.stats.setdefault(
+                (timing.metric, timing.target), [0, 0, 0, None]
+            )
+            stats[0] += 1
+            stats[1] += timing.seconds
+            stats[2] = max(stats[2], timing.seconds)
+            if timing.queries is not None:
+                stats[3] = (stats[3] or 0) + timing.queries
+
+    def get_stats(self) -> List[TimingStats]:
+        "returns the stats of every metric and target, by total time"
+        with self.lock:
+            stats = [TimingStats(*key, *values) for key, values in self.stats.items()]
+        return sorted(stats, key=lambda x: x.total_seconds, reverse=True)
+
+    def reset(self):
+        with self.lock:
+            self.stats.clear()
+
+
+_sinks: Dict[Tuple[str, ...], List[Sink]] = {}
+
+
+def get_sinks() -> List[Sink]:
+    "returns the sinks configured by CUSTOM_ADMIN_INSTRUMENTATION_SINKS, created once"
+    paths = tuple(app_settings.CUSTOM_ADMIN_INSTRUMENTATION_SINKS)
+    if paths not in _sinks:
+        _sinks[paths] = [import_string(path)() for path in paths]
+    return _sinks[paths]
+
+
+def record(timing: Timing):
+    for sink in get_sinks():
+        try:
+            sink.emit(timing)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # a failing sink mustn't break the request or other sinks
+            logger.exception("Instrumentation sink %s failed", sink)
@@ -0,0 +1,171 @@
+import logging
+import uuid
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Union
+
+from django.core.cache import BaseCache, caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.utils.module_loading import import_string
+
+from .app_settings import app_settings
+from .cache import CACHE_KEY_PREFIX
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+SUCCESS = "success"
+FAILURE = "failure"
+
+JobStatus = namedtuple(
+    "JobStatus",
+    ["job_id", "state", "done", "total", "message", "result", "error"],
+    defaults=[0, None, "", None, None],
+)
+
+
+def get_job_cache() -> BaseCache:
+    "returns the cache configured by CUSTOM_ADMIN_JOB_CACHE that holds job statuses"
+    return caches[app_settings.CUSTOM_ADMIN_JOB_CACHE]
+
+
+def get_job_status_key(job_id: str) -> str:
+    return f"{CACHE_KEY_PREFIX}:job:{job_id}"
+
+
+def get_job_status(job_id: str) -> Optional[JobStatus]:
+    status = get_job_cache().get(get_job_status_key(job_id))
+    if status is None:
+        return None
+    return JobStatus(**status)
+
+
+def set_job_status(status: JobStatus):
+    get_job_cache().set(
+        get_job_status_key(status.job_id),
+        status._asdict(),
+        app_settings.CUSTOM_ADMIN_JOB_STATUS_TIMEOUT,
+    )
+
+
+class JobProgress:
+    """
+    Passed to job functions as their first argument to report progress.
+    """
+
+    def __init__(self, job_id: str):
+        self.status = JobStatus(job_id, RUNNING)
+
+    def update(self, done: int, total: Optional[int] = None, message: str = ""):
+        changes = {"done": done, "message": message}
+        if total is not None:
+            changes["total"] = total
+        self.status = self.status._replace(**changes)
+        set_job_status(self.status)
+
+
+def run_job(job_id: str, func_path: str, args: tuple, kwargs: Dict[str, Any]):
+    """
+    Runs the job function at func_path and stores its result or error in the job
+    status. Called by job executors, in whichever thread or process runs the job.
+    """
+    progress = JobProgress(job_id)
+    set_job_status(progress.status)
+    try:
+        result = import_string(func_path)(progress, *args, **kwargs)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.exception("Custom admin job %s (%s) failed", job_id, func_path)
+        set_job_status(progress.status._replace(state=FAILURE, error=str(e)))
+    else:
+        set_job_status(progress.status._replace(state=SUCCESS, result=result))
+    finally:
+        connections.close_all()
+
+
+class JobExecutor:
+    """
+    Runs submitted jobs. To run jobs elsewhere, e.g. on a task queue, subclass it,
+    call run_job(job_id, func_path, args, kwargs) from the worker and set
+    CUSTOM_ADMIN_JOB_EXECUTOR to the dotted path of the subclass.
+    """
+
+    def submit(self, job_id: str, func_path: str, args: tuple, kwargs: Dict[str, Any]):
+        raise NotImplementedError("subclasses of JobExecutor must provide submit()")
+
+
+class ThreadJobExecutor(JobExecutor):
+    """
+    Runs jobs in a thread pool of the web server process. Jobs are lost if the
+    process exits.
+    """
+
+    max_workers = 4
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="custom_admin_job"
+        )
+
+    def submit(self, job_id, func_path, args, kwargs):
+        self.executor.submit(run_job, job_id, func_path, args, kwargs)
+
+
+def setup_django():
+    import django
+
+    django.setup()
+
+
+class ProcessJobExecutor(JobExecutor):
+    """
+    Runs jobs in a process pool. Requires a CUSTOM_ADMIN_JOB_CACHE shared between
+    processes, such as redis or memcached, and picklable job arguments.
+    """
+
+    max_workers = 2
+
+    def __init__(self):
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=setup_django
+        )
+
+    def submit(self, job_id, func_path, args, kwargs):
+        self.executor.submit(run_job, job_id, func_path, args, kwargs)
+
+
+_job_executors: Dict[str, JobExecutor] = {}
+
+
+def get_job_executor() -> JobExecutor:
+    "returns the executor configured by CUSTOM_ADMIN_JOB_EXECUTOR, created once"
+    path = app_settings.CUSTOM_ADMIN_JOB_EXECUTOR
+    if path not in _job_executors:
+        _job_executors[path] = import_string(path)()
+    return _job_executors[path]
+
+
+def get_func_path(func: Union[str, Callable]) -> str:
+    if isinstance(func, str):
+        return func
+    func_path = f"{func.__module__}.{func.__qualname__}"
+    if "<" in func_path or "." in func.__qualname__:
+        raise ImproperlyConfigured(
+            f"Job function {func_path} must be a module level function so it can be imported by the job executor."
+        )
+    return func_path
+
+
+def submit_job(func: Union[str, Callable], /, *args, **kwargs) -> str:
+    """
+    Submits func to the job executor and returns the job id. func is called with a
+    JobProgress followed by args and kwargs, and may be a function or its dotted path.
+    Its return value is stored in the job status and should be small, picklable and
+    JSON serializable.
+    """
+    func_path = get_func_path(func)
+    job_id = uuid.uuid4().hex
+    set_job_status(JobStatus(job_id, PENDING))
+    get_job_executor().submit(job_id, func_path, args, kwargs)
+    return job_id
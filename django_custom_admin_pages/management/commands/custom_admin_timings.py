@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from ... import discovery
+
+
+class Command(BaseCommand):
+    help = "Shows how long importing each app's admin_views module took at startup, slowest first."
+
+    def handle(self, *args, **options):
+        if not discovery.module_timings:
+            self.stdout.write("No admin_views modules were imported.")
+            return
+
+        timings = sorted(
+            discovery.module_timings, key=lambda x: x.seconds, reverse=True
+        )
+        width = max(len("Total"), *(len(timing.module) for timing in timings))
+        for timing in timings:
+            self.stdout.write(
+                f"{timing.module:<{width}}  {timing.seconds * 1000:9.1f} ms"
+            )
+        total = sum(timing.seconds for timing in timings)
+        self.stdout.write(f"{'Total':<{width}}  {total * 1000:9.1f} ms")
@@ -0,0 +1,94 @@
+from collections import defaultdict
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Tuple, Type
+
+from django.contrib import admin
+
+if TYPE_CHECKING:
+    from .views.admin_base_view import AdminBaseView
+
+
+class ViewRegistry:
+    """
+    Registered views in registration order, hashed by view class and indexed by
+    route_name and (lowercased) app_label. Views must have their app_label and
+    route_name set before they are added.
+    """
+
+    def __init__(self):
+        # dicts keep registration order, values are unused
+        self._views: Dict[Type["AdminBaseView"], None] = {}
+        self._by_route_name: Dict[str, Type["AdminBaseView"]] = {}
+        self._by_app_label: Dict[str, Dict[Type["AdminBaseView"], None]] = defaultdict(
+            dict
+        )
+
+    def __contains__(self, view) -> bool:
+        return view in self._views
+
+    def __iter__(self) -> Iterator[Type["AdminBaseView"]]:
+        return iter(self._views)
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def add(self, view: Type["AdminBaseView"]):
+        """
+        :raise admin.sites.AlreadyRegistered: If view or its route_name is already registered.
+        """
+        if view in self._views:
+            raise admin.sites.AlreadyRegistered(
+                f"View: {str(view.view_name)} is already registered."
+            )
+        if registered := self._by_route_name.get(view.route_name):
+            raise admin.sites.AlreadyRegistered(
+                f"View: {str(view.view_name)} has route_name {view.route_name} which is already registered by {registered.__name__}."
+            )
+
+        self._views[view] = None
+        self._by_route_name[view.route_name] = view
+        self._by_app_label[view.app_label.lower()][view] = None
+
+    def remove(self, view: Type["AdminBaseView"]):
+        """
+        :raise admin.sites.NotRegistered: If view is not registered.
+        """
+        if view not in self._views:
+            raise admin.sites.NotRegistered(
+                f"The view {getattr(view, '__name__', view)} is not registered"
+            )
+
+        del self._views[view]
+        del self._by_route_name[view.route_name]
+        app_label = view.app_label.lower()
+        del self._by_app_label[app_label][view]
+        if not self._by_app_label[app_label]:
+            del self._by_app_label[app_label]
+
+    def freeze(self):
+        """
+        Makes the registry read only, views can't be added or removed anymore.
+        """
+        self._views = MappingProxyType(self._views)
+        self._by_route_name = MappingProxyType(self._by_route_name)
+        self._by_app_label = MappingProxyType(
+            {
+                app_label: MappingProxyType(views)
+                for app_label, views in self._by_app_label.items()
+            }
+        )
+
+    def copy(self) -> "ViewRegistry":
+        registry = ViewRegistry()
+        for view in self:
+            registry.add(view)
+        return registry
+
+    def get_by_route_name(self, route_name: str) -> Optional[Type["AdminBaseView"]]:
+        return self._by_route_name.get(route_name)
+
+    def get_app_labels(self) -> Tuple[str, ...]:
+        return tuple(self._by_app_label)
+
+    def get_by_app_label(self, app_label: str) -> Tuple[Type["AdminBaseView"], ...]:
+        return tuple(self._by_app_label.get(app_label.lower(), ()))
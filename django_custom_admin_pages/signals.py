@@ -0,0 +1,40 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from .cache import bump_permission_version
+
+
+def invalidate_menu_cache(**kwargs):
+    "bumps the permission version so that cached custom view menus are rebuilt"
+    bump_permission_version()
+
+
+def connect_signals():
+    """
+    Connects the signals that change which custom views users can see.
+    """
+    for model in (Group, Permission):
+        post_save.connect(
+            invalidate_menu_cache,
+            sender=model,
+            dispatch_uid=f"custom_admin_menu_{model.__name__}_save",
+        )
+        post_delete.connect(
+            invalidate_menu_cache,
+            sender=model,
+            dispatch_uid=f"custom_admin_menu_{model.__name__}_delete",
+        )
+
+    m2m_fields = [Group.permissions]
+    user_model = get_user_model()
+    for field_name in ("groups", "user_permissions"):
+        if hasattr(user_model, field_name):
+            m2m_fields.append(getattr(user_model, field_name))
+
+    for field in m2m_fields:
+        m2m_changed.connect(
+            invalidate_menu_cache,
+            sender=field.through,
+            dispatch_uid=f"custom_admin_menu_{field.through.__name__}_changed",
+        )
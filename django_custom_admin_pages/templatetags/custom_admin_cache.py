@@ -0,0 +1,33 @@
+from django import template
+
+register = template.Library()
+
+
+class CustomAdminCacheNode(template.Node):
+    def __init__(self, nodelist):
+        self.nodelist = nodelist
+
+    def render(self, context):
+        content_cache = context.get("custom_admin_content_cache")
+        if content_cache is None:
+            return self.nodelist.render(context)
+        return content_cache.render(lambda: self.nodelist.render(context))
+
+
+@register.tag("custom_admin_cache")
+def do_custom_admin_cache(parser, _token):
+    """
+    Caches its content using the content cache of the AdminBaseView rendering the
+    template. Renders normally if the view has no content_cache_timeout or the request
+    isn't a GET or HEAD. Keep forms and csrf tokens outside of it.
+
+    Usage::
+
+        {% load custom_admin_cache %}
+        {% custom_admin_cache %}
+            ...
+        {% endcustom_admin_cache %}
+    """
+    nodelist = parser.parse(("endcustom_admin_cache",))
+    parser.delete_first_token()
+    return CustomAdminCacheNode(nodelist)
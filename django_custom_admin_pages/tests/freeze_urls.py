@@ -0,0 +1,22 @@
+"""
+Root url conf that registers a view when it's imported, like the README suggests. Used
+to freeze the admin site before the url conf is loaded.
+"""
+from django.contrib import admin
+from django.urls import path
+from django.views.generic import TemplateView
+
+from ..views.admin_base_view import AdminBaseView
+
+
+class FreezeUrlconfView(AdminBaseView, TemplateView):
+    view_name = "Freeze Urlconf View"
+    route_name = "freeze_urlconf_view"
+    template_name = "base_custom_admin.html"
+
+
+admin.site.register_view(FreezeUrlconfView)
+
+urlpatterns = [
+    path("admin/", admin.site.urls),
+]
@@ -0,0 +1,27 @@
+"""
+Views that are registered lazily by the tests, this module must only be imported when
+they are dispatched.
+"""
+from django.views.generic import TemplateView
+
+from test_app.models import SomeModel
+
+from ..views.admin_base_view import AdminBaseView
+from ..views.admin_export_view import AdminExportView
+from ..views.admin_job_view import AdminJobView
+
+
+class LazyReportView(AdminBaseView, TemplateView):
+    view_name = "Lazy Report"
+    template_name = "base_custom_admin.html"
+    permission_required = "test_app.test_perm"
+
+
+class LazyExportView(AdminExportView):
+    view_name = "Lazy Export"
+    model = SomeModel
+
+
+class LazyJobView(AdminJobView):
+    view_name = "Lazy Job"
+    job_function = "django_custom_admin_pages.tests.test_jobs.count_to"
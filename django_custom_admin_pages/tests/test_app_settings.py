@@ -0,0 +1,34 @@
+import pytest
+
+from ..app_settings import DEFAULTS, app_settings
+
+
+class TestAppSettings:
+    def test_defaults(self):
+        assert app_settings.CUSTOM_ADMIN_MENU_CACHE_TIMEOUT == 300
+        assert (
+            app_settings.CUSTOM_ADMIN_DEFAULT_APP_LABEL == "django_custom_admin_pages"
+        )
+
+    def test_only_uppercase_defaults(self):
+        assert DEFAULTS
+        assert all(name.isupper() for name in DEFAULTS)
+
+    def test_it_caches_settings(self):
+        app_settings.reload()
+        app_settings.CUSTOM_ADMIN_MENU_CACHE_TIMEOUT
+        assert app_settings.__dict__ == {"CUSTOM_ADMIN_MENU_CACHE_TIMEOUT": 300}
+
+    def test_it_reloads_on_setting_changed(self, settings):
+        app_settings.CUSTOM_ADMIN_MENU_CACHE_TIMEOUT
+        settings.CUSTOM_ADMIN_MENU_CACHE_TIMEOUT = 10
+        assert app_settings.CUSTOM_ADMIN_MENU_CACHE_TIMEOUT == 10
+
+    def test_other_settings_keep_cache(self, settings):
+        app_settings.CUSTOM_ADMIN_MENU_CACHE_TIMEOUT
+        settings.DEBUG = False
+        assert "CUSTOM_ADMIN_MENU_CACHE_TIMEOUT" in app_settings.__dict__
+
+    def test_unknown_setting(self):
+        with pytest.raises(AttributeError):
+            app_settings.CUSTOM_ADMIN_UNKNOWN
@@ -1,22 +1,49 @@
+import asyncio
+import json
 import sys
+import threading
 from importlib import reload
+from unittest import mock
 
+import django
 from django.conf import settings
 from django.contrib import admin
 from django.contrib.auth import get_user_model
-from django.contrib.auth.models import AbstractUser, Permission
+from django.contrib.auth.models import AbstractUser, Group, Permission
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
 from django.shortcuts import render
 from django.test import RequestFactory
-from django.urls import clear_url_caches, reverse
+from django.urls import (
+    NoReverseMatch,
+    Resolver404,
+    clear_url_caches,
+    get_script_prefix,
+    resolve,
+    reverse,
+    set_script_prefix,
+)
+from django.utils import timezone, translation
 from django.utils.text import get_valid_filename, slugify
 from django.views.generic import TemplateView
 
 import pytest
-
+from test_app.models import SomeModel
+
+from ..admin import CustomAdminSite
+from ..cache import ContentCache
+from ..checks import (
+    check_custom_admin_permissions,
+    check_custom_admin_views,
+    get_missing_permissions,
+)
 from ..exceptions import CustomAdminImportException
+from ..urls import build_urlpatterns
+from ..views import admin_base_view
 from ..views.admin_base_view import AdminBaseView
+from ..views.admin_export_view import AdminExportView
+from ..views.async_admin_base_view import AsyncAdminBaseView, AsyncAdminTemplateView
 
 User: AbstractUser = get_user_model()
 
@@ -50,6 +77,148 @@ class AnExampleAppView(AdminBaseView, TemplateView):
     permission_required = "test_app.test_perm"
 
 
+class RuleBackend:
+    "authentication backend that only implements has_perm"
+
+    def authenticate(self, request, **credentials):
+        return None
+
+    def has_perm(self, user_obj, perm, obj=None):
+        return perm == "test_app.test_perm"
+
+
+class OverriddenPermissionView(AnExampleAppView):
+    route_name = "overridden_permission_route"
+
+    def user_has_permission(self, user):
+        return user.is_superuser
+
+
+class CachedView(AdminBaseView, TemplateView):
+    view_name = "Cached View"
+    route_name = "cached_view"
+    template_name = "base_custom_admin.html"
+    cache_policy = "private"
+    cache_max_age = 60
+
+    def get_etag(self, request, *args, **kwargs):
+        return "v1"
+
+
+class ContentCachedView(AdminBaseView, TemplateView):
+    view_name = "Content Cached View"
+    route_name = "content_cached_view"
+    template_name = "cached_content.html"
+    content_cache_timeout = 60
+    report_count = 0
+
+    def get_context_data(self, *args, **kwargs):
+        context = super().get_context_data(*args, **kwargs)
+        if not self.content_is_cached:
+            ContentCachedView.report_count += 1
+            context["report"] = f"report {self.report_count}"
+        return context
+
+    def post(self, request, *args, **kwargs):
+        # like a FormView re-rendering an invalid form
+        return self.get(request, *args, **kwargs)
+
+
+class AnAsyncView(AsyncAdminTemplateView):
+    view_name = "Async View"
+    app_label = "test_app"
+    route_name = "async_view"
+    template_name = "base_custom_admin.html"
+    permission_required = "test_app.test_perm"
+
+
+class MixedHandlersView(AsyncAdminBaseView):
+    view_name = "Mixed Handlers"
+    route_name = "mixed_handlers"
+
+    async def get(self, request, *args, **kwargs):
+        pass
+
+    def post(self, request, *args, **kwargs):
+        pass
+
+
+class NoHandlersAsyncView(AsyncAdminBaseView):
+    view_name = "No Handlers"
+    route_name = "no_handlers"
+
+
+class LoaderMixin:
+    context_loaders = (
+        admin_base_view.ContextLoader("first", "get_first"),
+        admin_base_view.ContextLoader("second", "get_second"),
+        admin_base_view.ContextLoader("broken", "get_broken", default=[]),
+        admin_base_view.ContextLoader(
+            "slow", "get_slow", timeout=0.1, default="timed out"
+        ),
+    )
+    barrier: threading.Barrier = None
+    release: threading.Event = None
+
+    def get_first(self):
+        self.barrier.wait()  # only passes if loaders run concurrently
+        return "first"
+
+    def get_second(self):
+        self.barrier.wait()
+        return "second"
+
+    def get_broken(self):
+        raise ValueError("broken")
+
+    def get_slow(self):
+        self.release.wait(5)
+        return "slow"
+
+
+class LoaderView(LoaderMixin, AdminBaseView, TemplateView):
+    view_name = "Context Loader View"
+    route_name = "context_loader_view"
+    template_name = "base_custom_admin.html"
+
+
+class AsyncLoaderView(LoaderMixin, AsyncAdminTemplateView):
+    view_name = "Async Context Loader View"
+    route_name = "async_context_loader_view"
+    template_name = "base_custom_admin.html"
+    context_loaders = LoaderMixin.context_loaders + (
+        admin_base_view.ContextLoader("third", "aget_third"),
+    )
+
+    async def aget_third(self):
+        await asyncio.sleep(0)
+        return "third"
+
+    async def get_slow(self):
+        await asyncio.sleep(5)
+        return "slow"
+
+
+class RequestStateLoaderView(AdminBaseView):
+    view_name = "Request State Loader View"
+    context_loaders = (admin_base_view.ContextLoader("state", "get_state"),)
+
+    def get_state(self):
+        return (
+            get_script_prefix(),
+            timezone.get_current_timezone_name(),
+            translation.get_language(),
+        )
+
+
+class SomeModelExportView(AdminExportView):
+    view_name = "Export Some Models"
+    app_label = "test_app"
+    route_name = "some_model_export"
+    model = SomeModel
+    chunk_size = 2
+
+
 class BadAppNameView(AnExampleView):
     app_label = "fake_app"
 
@@ -60,6 +229,29 @@ class AnotherExampleView(AdminBaseView, TemplateView):
     template_name = "base_custom_admin.html"
 
 
+class DuplicateRouteNameView(AdminBaseView, TemplateView):
+    view_name = "Duplicate Route Name"
+    route_name = "test_route"
+    template_name = "base_custom_admin.html"
+
+
+class IndexRouteNameView(AdminBaseView, TemplateView):
+    view_name = "Index Route Name"
+    route_name = "index"
+
+
+class BadPermissionView(AdminBaseView, TemplateView):
+    view_name = "Bad Permission"
+    route_name = "bad_permission"
+    permission_required = ("test_perm", "test_app.test_perm", "auth.user.view")
+
+
+class ConverterRoutePathView(AdminBaseView, TemplateView):
+    view_name = "Converter Route Path"
+    route_name = "converter_route_path"
+    route_path = "<int:pk>/"
+
+
 class NotInheritedView(TemplateView):
     view_name = "Test Name"
     route_name = "test_route"
@@ -128,6 +320,33 @@ class TestRegistration:
         admin.site.register_view([AnExampleView, AnotherExampleView])
         admin.site.unregister_view([AnExampleView, AnotherExampleView])
 
+    def test_register_duplicate_route_name_raises(self):
+        admin.site.register_view(AnExampleView)
+        try:
+            with pytest.raises(
+                admin.sites.AlreadyRegistered,
+                match="has route_name test_route which is already registered by AnExampleView",
+            ):
+                admin.site.register_view(DuplicateRouteNameView)
+        finally:
+            admin.site.unregister_view(AnExampleView)
+
+    def test_registry_lookups(self):
+        admin.site.register_view([AnotherExampleView, AnExampleView])
+        try:
+            assert admin.site.is_view_registered(AnExampleView)
+            assert admin.site.get_registered_view("test_route") is AnExampleView
+            registered = admin.site.get_registered_views()
+            assert registered.index(AnotherExampleView) < registered.index(
+                AnExampleView
+            )
+        finally:
+            admin.site.unregister_view([AnExampleView, AnotherExampleView])
+
+        assert not admin.site.is_view_registered(AnExampleView)
+        with pytest.raises(admin.sites.NotRegistered):
+            admin.site.get_registered_view("test_route")
+
     @pytest.mark.django_db
     def test_register_late_raises(self, superuser):
         admin.site.register_view(AnExampleView)
@@ -144,6 +363,18 @@ class TestRegistration:
 
         admin.site.unregister_view(AnExampleView)
 
+    def test_unregister_removes_url_on_reload(self):
+        admin.site.register_view(AnotherExampleView)
+        reload_urlconf()
+        assert (
+            reverse("admin:test_route1") == f"{django_custom_admin_pages_URL}test-name"
+        )
+
+        admin.site.unregister_view(AnotherExampleView)
+        reload_urlconf()
+        with pytest.raises(NoReverseMatch):
+            reverse("admin:test_route1")
+
     def test_register_bad_app_name(self):
         with pytest.raises(
             ImproperlyConfigured,
@@ -245,6 +476,446 @@ class TestPageRendering:
         assert test_view["view_only"]
 
 
+class TestFreeze:
+    @pytest.fixture
+    def frozen(self, app_view):
+        admin.site.freeze()
+        yield
+        admin.site.unfreeze()
+
+    def test_it_prevents_registration(self, frozen):
+        assert admin.site.is_frozen
+        with pytest.raises(ImproperlyConfigured):
+            admin.site.register_view(AnExampleView)
+        with pytest.raises(ImproperlyConfigured):
+            admin.site.unregister_view(AnExampleAppView)
+        with pytest.raises(TypeError):
+            admin.site._view_registry.add(AnExampleView)
+        assert admin.site.is_view_registered(AnExampleAppView)
+        assert not admin.site.is_view_registered(AnExampleView)
+
+    def test_it_reuses_url_patterns(self, frozen):
+        with mock.patch(
+            "django_custom_admin_pages.admin.build_urlpatterns"
+        ) as build_urlpatterns:
+            reload_urlconf()
+            assert resolve(reverse("admin:test_app_route")).func.view_class == (
+                AnExampleAppView
+            )
+        build_urlpatterns.assert_not_called()
+
+    def test_menu_is_built_on_freeze(self, app_view):
+        admin.site._menu_indexes.clear()
+        admin.site.freeze()
+        try:
+            with mock.patch.object(admin.site, "_build_menu_index") as build:
+                admin.site._get_menu_index()
+            build.assert_not_called()
+        finally:
+            admin.site.unfreeze()
+
+    def test_it_loads_the_urlconf_first(self, settings):
+        urlconf = "django_custom_admin_pages.tests.freeze_urls"
+        sys.modules.pop(urlconf, None)
+        settings.ROOT_URLCONF = urlconf
+        try:
+            admin.site.freeze()
+            view = sys.modules[urlconf].FreezeUrlconfView
+            assert admin.site.is_frozen
+            assert admin.site.is_view_registered(view)
+            assert resolve(reverse("admin:freeze_urlconf_view")).func.view_class == view
+        finally:
+            admin.site.unfreeze()
+            admin.site.unregister_view(sys.modules[urlconf].FreezeUrlconfView)
+
+    def test_it_stays_unfrozen_on_error(self, app_view):
+        admin.site._menu_indexes.clear()
+        with mock.patch.object(
+            admin.site, "_build_menu_index", side_effect=CustomAdminImportException
+        ):
+            with pytest.raises(CustomAdminImportException):
+                admin.site.freeze()
+        assert not admin.site.is_frozen
+        admin.site.register_view(AnExampleView)
+        admin.site.unregister_view(AnExampleView)
+
+    def test_unfreeze(self, frozen):
+        admin.site.unfreeze()
+        admin.site.register_view(AnExampleView)
+        admin.site.unregister_view(AnExampleView)
+        assert admin.site.get_registered_view("test_app_route") is AnExampleAppView
+        admin.site.freeze()
+
+
+class TestChecks:
+    @pytest.fixture
+    def site(self):
+        return CustomAdminSite(name="checks")
+
+    def get_check_ids(self, site, *views):
+        site.register_view(views)
+        return [error.id for error in site.check_views()]
+
+    def test_valid_views_pass(self, site):
+        assert self.get_check_ids(site, AnExampleView, AnExampleAppView) == []
+
+    def test_project_views_pass(self):
+        assert check_custom_admin_views() == []
+
+    def test_invalid_app_label(self, site):
+        site.register_view([AnExampleView, AnExampleAppView])
+        # e.g. INSTALLED_APPS changed after the views were registered
+        with mock.patch(
+            "django_custom_admin_pages.admin.get_installed_app_index", return_value={}
+        ):
+            assert [error.id for error in site.check_views()] == [
+                "django_custom_admin_pages.E001"
+            ]
+
+    def test_route_name_clash(self, site):
+        assert self.get_check_ids(site, IndexRouteNameView) == [
+            "django_custom_admin_pages.E002"
+        ]
+
+    def test_invalid_permission(self, site):
+        assert self.get_check_ids(site, BadPermissionView) == [
+            "django_custom_admin_pages.E003",
+            "django_custom_admin_pages.E003",
+        ]
+
+    @pytest.mark.django_db
+    def test_missing_permission(self):
+        assert get_missing_permissions(
+            [AnExampleView, AnExampleAppView], "default"
+        ) == {"test_app.test_perm": [AnExampleAppView]}
+
+        Permission.objects.create(
+            name="Test Perm",
+            codename="test_perm",
+            content_type=ContentType.objects.get(
+                app_label="test_app", model="somemodel"
+            ),
+        )
+        assert get_missing_permissions([AnExampleAppView], "default") == {}
+
+    @pytest.mark.django_db
+    def test_permission_check_needs_database(self, app_view):
+        assert check_custom_admin_permissions() == []
+        assert [
+            warning.id
+            for warning in check_custom_admin_permissions(databases=["default"])
+            if warning.obj is AnExampleAppView
+        ] == ["django_custom_admin_pages.W002"]
+
+    def test_route_path_with_converter(self, site):
+        assert self.get_check_ids(site, ConverterRoutePathView) == [
+            "django_custom_admin_pages.W001"
+        ]
+
+
+class TestURLResolution:
+    def test_it_resolves_view(self, app_view):
+        match = resolve("/admin/test_app/test-app-view")
+        assert match.url_name == "test_app_route"
+        assert match.func.view_class is AnExampleAppView
+        assert match.route == "admin/test_app/test-app-view"
+
+    def test_it_falls_through_to_model_admin(self, app_view):
+        match = resolve("/admin/test_app/somemodel/")
+        assert match.url_name == "test_app_somemodel_changelist"
+
+    def test_it_only_tries_matching_app(self, view, app_view):
+        resolver = build_urlpatterns([AnExampleView, AnExampleAppView])[0]
+        app_resolvers = resolver._app_resolvers
+        assert set(app_resolvers) == {"django_custom_admin_pages", "test_app"}
+
+        with mock.patch.object(
+            app_resolvers["django_custom_admin_pages"],
+            "resolve",
+            side_effect=AssertionError,
+        ):
+            assert resolver.resolve("test_app/test-app-view").url_name == (
+                "test_app_route"
+            )
+            with pytest.raises(Resolver404):
+                resolver.resolve("auth/user/")
+            with pytest.raises(Resolver404):
+                resolver.resolve("test_app/missing")
+
+
+class TestCachePolicy:
+    @pytest.fixture
+    def view_to_register(self):
+        return CachedView
+
+    @pytest.fixture
+    def super_client(self, client, superuser):
+        client.force_login(superuser)
+        return client
+
+    @pytest.mark.django_db
+    def test_default_is_never_cache(self, view, super_client):
+        r = super_client.get(reverse("admin:test_route"))
+        assert r.status_code == 200
+        assert "no-cache" in r["Cache-Control"]
+        assert not r.has_header("ETag")
+
+    @pytest.mark.django_db
+    def test_private_cache_headers(self, app_view, super_client):
+        r = super_client.get(reverse("admin:cached_view"))
+        assert r.status_code == 200
+        assert r["ETag"] == '"v1"'
+        assert set(r["Cache-Control"].split(", ")) == {"private", "max-age=60"}
+        assert "Cookie" in r["Vary"]
+
+    @pytest.mark.django_db
+    def test_not_modified(self, app_view, super_client):
+        with mock.patch.object(CachedView, "get", side_effect=AssertionError):
+            r = super_client.get(
+                reverse("admin:cached_view"), HTTP_IF_NONE_MATCH='"v1"'
+            )
+        assert r.status_code == 304
+
+    @pytest.mark.django_db
+    def test_modified(self, app_view, super_client):
+        r = super_client.get(reverse("admin:cached_view"), HTTP_IF_NONE_MATCH='"v0"')
+        assert r.status_code == 200
+
+    @pytest.mark.django_db
+    def test_permission_checked_first(self, app_view, client):
+        r = client.get(reverse("admin:cached_view"), HTTP_IF_NONE_MATCH='"v1"')
+        assert r.status_code == 302
+        assert "no-cache" in r["Cache-Control"]
+
+
+class TestContentCache:
+    @pytest.fixture
+    def view_to_register(self):
+        return ContentCachedView
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        caches["default"].clear()
+        ContentCachedView.report_count = 0
+        yield
+        caches["default"].clear()
+
+    @pytest.fixture
+    def other_superuser(self):
+        return User.objects.create(
+            username="Alice", is_staff=True, is_active=True, is_superuser=True
+        )
+
+    @pytest.mark.django_db
+    def test_it_caches_content(self, app_view, client, superuser, other_superuser):
+        url = reverse("admin:content_cached_view")
+        client.force_login(superuser)
+        assert "report 1" in client.get(url).content.decode()
+
+        client.force_login(other_superuser)
+        content = client.get(url).content.decode()
+        assert "report 1" in content
+        assert "Alice" in content  # admin chrome is still rendered per user
+        assert ContentCachedView.report_count == 1
+
+    @pytest.mark.django_db
+    def test_it_only_caches_get_requests(self, app_view, client, superuser):
+        url = reverse("admin:content_cached_view")
+        client.force_login(superuser)
+        client.get(url)
+        assert "report 2" in client.post(url).content.decode()
+        assert "report 1" in client.get(url).content.decode()
+
+    @pytest.mark.django_db
+    def test_it_varies_on_query_string(self, app_view, client, superuser):
+        url = reverse("admin:content_cached_view")
+        client.force_login(superuser)
+        client.get(url)
+        assert "report 2" in client.get(url, {"page": 2}).content.decode()
+
+    @pytest.mark.django_db
+    def test_it_varies_on_permissions(self, app_view, client, superuser):
+        staff = User.objects.create(username="Bob", is_staff=True, is_active=True)
+        url = reverse("admin:content_cached_view")
+        client.force_login(superuser)
+        client.get(url)
+        client.force_login(staff)
+        assert "report 2" in client.get(url).content.decode()
+
+    def test_it_waits_for_locked_content(self):
+        cache = caches["default"]
+        content_cache = ContentCache(cache, "locked", 60, 1)
+        cache.add("locked:lock", 1)
+
+        def finish_render(seconds):
+            cache.set("locked", "rendered elsewhere")
+
+        with mock.patch("django_custom_admin_pages.cache.time.sleep", finish_render):
+            content = content_cache.render(mock.Mock(side_effect=AssertionError))
+        assert content == "rendered elsewhere"
+
+
+@pytest.mark.skipif(django.VERSION < (4, 1), reason="async views need 4.1+")
+class TestAsyncView:
+    @pytest.fixture
+    def view_to_register(self):
+        return AnAsyncView
+
+    @pytest.fixture
+    def staff_user(self):
+        return User.objects.create(username="Bill", is_staff=True, is_active=True)
+
+    @pytest.mark.django_db
+    def test_it_renders(self, app_view, client, superuser):
+        client.force_login(superuser)
+        r = client.get(reverse("admin:async_view"))
+        assert r.status_code == 200
+        assert "no-cache" in r["Cache-Control"]
+        test_app = [x for x in r.context["app_list"] if x["app_label"] == "test_app"]
+        assert "Async View" in [x["name"] for x in test_app[0]["models"]]
+
+    @pytest.mark.django_db
+    def test_it_checks_permission(self, app_view, client, staff_user):
+        client.force_login(staff_user)
+        r = client.get(reverse("admin:async_view"))
+        assert r.status_code == 403
+
+        permission = Permission.objects.create(
+            name="Test Perm",
+            codename="test_perm",
+            content_type=ContentType.objects.get(
+                app_label="test_app", model="somemodel"
+            ),
+        )
+        staff_user.user_permissions.add(permission)
+        r = client.get(reverse("admin:async_view"))
+        assert r.status_code == 200
+
+    @pytest.mark.django_db
+    def test_it_redirects_anonymous_user(self, app_view, client):
+        r = client.get(reverse("admin:async_view"))
+        assert r.status_code == 302
+
+    def test_it_is_async(self):
+        assert AnAsyncView.view_is_async
+
+    def test_it_raises_on_mixed_handlers(self):
+        with pytest.raises(ImproperlyConfigured):
+            admin.site.register_view(MixedHandlersView)
+        assert not admin.site.is_view_registered(MixedHandlersView)
+
+    def test_it_raises_without_handlers(self):
+        with pytest.raises(ImproperlyConfigured):
+            admin.site.register_view(NoHandlersAsyncView)
+
+
+class TestContextLoaders:
+    @pytest.fixture(autouse=True)
+    def loader_state(self):
+        LoaderMixin.barrier = threading.Barrier(2, timeout=5)
+        LoaderMixin.release = threading.Event()
+        yield
+        LoaderMixin.release.set()
+
+    @pytest.fixture
+    def super_client(self, client, superuser):
+        client.force_login(superuser)
+        return client
+
+    def assert_loaded(self, context):
+        assert context["first"] == "first"
+        assert context["second"] == "second"
+        assert context["broken"] == []
+        assert context["slow"] == "timed out"
+        assert set(context["context_loader_errors"]) == {"broken", "slow"}
+        assert isinstance(context["context_loader_errors"]["broken"], ValueError)
+        assert "app_list" in context
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("view_to_register", [LoaderView])
+    def test_it_loads_concurrently(self, app_view, super_client):
+        r = super_client.get(reverse("admin:context_loader_view"))
+        assert r.status_code == 200
+        self.assert_loaded(r.context)
+
+    @pytest.mark.django_db
+    @pytest.mark.skipif(django.VERSION < (4, 1), reason="async views need 4.1+")
+    @pytest.mark.parametrize("view_to_register", [AsyncLoaderView])
+    def test_it_gathers_under_async(self, app_view, super_client):
+        r = super_client.get(reverse("admin:async_context_loader_view"))
+        assert r.status_code == 200
+        self.assert_loaded(r.context)
+        assert r.context["third"] == "third"
+
+    def test_loaders_see_request_state(self):
+        set_script_prefix("/myapp/")
+        try:
+            with timezone.override("Europe/Paris"), translation.override("fr"):
+                loaded = RequestStateLoaderView().load_context()
+        finally:
+            set_script_prefix("/")
+        assert loaded["state"] == ("/myapp/", "Europe/Paris", "fr")
+
+    def test_views_without_loaders_are_unchanged(self):
+        with mock.patch.object(AnExampleView, "load_context") as load_context:
+            view = AnExampleView()
+            view.setup(RequestFactory().get("/"))
+            with mock.patch.object(admin.site, "each_context", return_value={}):
+                view.get_context_data()
+        load_context.assert_not_called()
+
+
+class TestExport:
+    @pytest.fixture
+    def view_to_register(self):
+        return SomeModelExportView
+
+    @pytest.fixture
+    def rows(self):
+        return [SomeModel.objects.create(some_field=i % 2 == 0).pk for i in range(5)]
+
+    @pytest.fixture
+    def super_client(self, client, superuser):
+        client.force_login(superuser)
+        return client
+
+    @pytest.mark.django_db
+    def test_csv(self, app_view, rows, super_client):
+        r = super_client.get(reverse("admin:some_model_export"))
+        assert r.status_code == 200
+        assert r.streaming
+        assert r["Content-Type"] == "text/csv"
+        assert r["Content-Disposition"] == (
+            'attachment; filename="some_model_export.csv"'
+        )
+        assert "no-cache" in r["Cache-Control"]
+        content = b"".join(r.streaming_content).decode()
+        assert content.splitlines() == ["id,some_field"] + [
+            f"{pk},{i % 2 == 0}" for i, pk in enumerate(rows)
+        ]
+
+    @pytest.mark.django_db
+    def test_json(self, app_view, rows, super_client):
+        with mock.patch.object(SomeModelExportView, "export_format", "json"):
+            r = super_client.get(reverse("admin:some_model_export"))
+        assert r["Content-Type"] == "application/json"
+        content = json.loads(b"".join(r.streaming_content))
+        assert content == [
+            {"id": pk, "some_field": i % 2 == 0} for i, pk in enumerate(rows)
+        ]
+
+    @pytest.mark.django_db
+    def test_empty_json(self, app_view, super_client):
+        with mock.patch.object(SomeModelExportView, "export_format", "json"):
+            r = super_client.get(reverse("admin:some_model_export"))
+        assert json.loads(b"".join(r.streaming_content)) == []
+
+    @pytest.mark.django_db
+    def test_permission_required(self, app_view, client):
+        r = client.get(reverse("admin:some_model_export"))
+        assert r.status_code == 302
+
+
 class TestGetAppList:
     class TestCaseStandardRegistration:
         """test an app registered in INSTALLED_APPS with just app name"""
@@ -284,6 +955,169 @@ class TestGetAppList:
                 == 1
             )
 
+    class TestCaseMenuIndex:
+        """test the menu index is built once and reset on (un)registration"""
+
+        @pytest.mark.django_db
+        def test_it_reuses_index_between_requests(self, superuser, app_view):
+            request_factory = RequestFactory()
+            request = request_factory.get(reverse("admin:index"))
+            request.user = superuser
+
+            admin.site.get_app_list(request)
+            menu_index = admin.site._get_menu_index()
+            admin.site.get_app_list(request)
+            assert admin.site._get_menu_index() is menu_index
+            assert "test_app.test_perm" in menu_index.permissions
+            assert [x.view for x in menu_index.apps["test_app"].entries] == [
+                AnExampleAppView
+            ]
+
+        @pytest.mark.django_db
+        def test_it_resets_index_on_unregister(self, superuser, app_view):
+            menu_index = admin.site._get_menu_index()
+            admin.site.unregister_view(AnExampleAppView)
+            try:
+                assert "test_app" not in admin.site._get_menu_index().apps
+                assert admin.site._get_menu_index() is not menu_index
+            finally:
+                admin.site.register_view(AnExampleAppView)
+
+    class TestCaseAppIndex:
+        """test get_app_list with an app_label only looks at that app's views"""
+
+        @pytest.mark.skipif(
+            django.VERSION < (4, 1), reason="get_app_list has app_label in 4.1+"
+        )
+        @pytest.mark.django_db
+        def test_it_only_checks_app_views(self, superuser, view, app_view):
+            request = RequestFactory().get(reverse("admin:app_list", args=["test_app"]))
+            request.user = superuser
+
+            with mock.patch.object(
+                AnExampleView, "user_has_class_permission", side_effect=AssertionError
+            ):
+                app_list = admin.site.get_app_list(request, app_label="test_app")
+
+            assert [x["app_label"] for x in app_list] == ["test_app"]
+            assert "Test App View" in [x["name"] for x in app_list[0]["models"]]
+
+        @pytest.mark.skipif(
+            django.VERSION < (4, 1), reason="get_app_list has app_label in 4.1+"
+        )
+        @pytest.mark.django_db
+        def test_app_index_page(self, client, superuser, app_view):
+            client.force_login(superuser)
+            r = client.get(reverse("admin:app_list", args=["test_app"]))
+            assert r.status_code == 200
+            assert [x["app_label"] for x in r.context["app_list"]] == ["test_app"]
+
+    class TestCaseMenuURLs:
+        """test view urls are built from a single reverse of the admin index"""
+
+        @pytest.mark.django_db
+        def test_it_reverses_index_only(self, superuser, app_view, view):
+            request = RequestFactory().get(reverse("admin:index"))
+            request.user = superuser
+
+            with mock.patch(
+                "django_custom_admin_pages.admin.reverse", wraps=reverse
+            ) as reverse_:
+                admin.site._menu_indexes.clear()
+                app_list = admin.site.get_app_list(request)
+            reverse_.assert_called_once_with("admin:index")
+
+            urls = {
+                model["admin_url"]
+                for app in app_list
+                for model in app["models"]
+                if model["name"] in ("Test Name", "Test App View")
+            }
+            assert urls == {
+                reverse("admin:test_route"),
+                reverse("admin:test_app_route"),
+            }
+
+        @pytest.mark.django_db
+        def test_it_quotes_urls_like_reverse(self, superuser):
+            view = type(
+                "UnicodeRouteView",
+                (AnExampleView,),
+                {"route_name": "unicode_route", "route_path": "ünï cöde/"},
+            )
+            admin.site.register_view(view)
+            reload_urlconf()
+            request = RequestFactory().get(reverse("admin:index"))
+            request.user = superuser
+            try:
+                app_list = admin.site.get_app_list(request)
+                url = reverse("admin:unicode_route")
+            finally:
+                admin.site.unregister_view(view)
+                reload_urlconf()
+            assert url == "/admin/django_custom_admin_pages/%C3%BCn%C3%AF%20c%C3%B6de/"
+            assert url in [
+                model["admin_url"] for app in app_list for model in app["models"]
+            ]
+
+        @pytest.mark.django_db
+        def test_it_rebuilds_urls_for_script_prefix(self, superuser, app_view):
+            request = RequestFactory().get(reverse("admin:index"))
+            request.user = superuser
+            menu_index = admin.site._get_menu_index()
+
+            set_script_prefix("/prefix/")
+            try:
+                prefixed_index = admin.site._get_menu_index()
+                app_list = admin.site.get_app_list(request)
+            finally:
+                set_script_prefix("/")
+
+            assert prefixed_index is not menu_index
+            assert admin.site._get_menu_index() is menu_index
+            test_app = [x for x in app_list if x["app_label"] == "test_app"][0]
+            assert "/prefix/admin/test_app/test-app-view" in [
+                x["admin_url"] for x in test_app["models"]
+            ]
+
+    class TestCaseRequestCache:
+        """test the app_list is only built once per request"""
+
+        @pytest.fixture
+        def request_(self, superuser):
+            request = RequestFactory().get(reverse("admin:index"))
+            request.user = superuser
+            return request
+
+        @pytest.mark.django_db
+        def test_it_builds_once_per_request(self, request_, app_view):
+            with mock.patch.object(
+                admin.site, "_build_app_list", wraps=admin.site._build_app_list
+            ) as build:
+                app_list = admin.site.get_app_list(request_)
+                admin.site.each_context(request_)
+                assert admin.site.get_app_list(request_) == app_list
+            assert build.call_count == 1
+
+        @pytest.mark.django_db
+        def test_it_builds_per_app_label(self, request_, app_view):
+            with mock.patch.object(
+                admin.site, "_build_app_list", wraps=admin.site._build_app_list
+            ) as build:
+                admin.site.get_app_list(request_)
+                admin.site.get_app_list(request_, app_label="test_app")
+                admin.site.get_app_list(request_, app_label="test_app")
+            assert build.call_count == 2
+
+        @pytest.mark.django_db
+        def test_it_returns_copies(self, request_, app_view):
+            app_list = admin.site.get_app_list(request_)
+            app_list[0]["models"][0]["name"] = "Changed"
+            app_list.append({})
+            cached_app_list = admin.site.get_app_list(request_)
+            assert len(cached_app_list) == len(app_list) - 1
+            assert cached_app_list[0]["models"][0]["name"] != "Changed"
+
 
 class TestPermissions:
     @pytest.fixture
@@ -365,6 +1199,119 @@ class TestPermissions:
             app_list = admin.site.get_app_list(request)
             assert len([x for x in app_list if x["name"] == "Test_App"]) == 0
 
+    class TestCaseClassPermission:
+        @pytest.mark.django_db
+        def test_it_does_not_instantiate_views(self, user, app_view):
+            request_factory = RequestFactory()
+            request = request_factory.get(reverse("admin:index"))
+            request.user = user
+
+            with mock.patch.object(
+                AnExampleAppView, "__init__", side_effect=AssertionError
+            ):
+                app_list = admin.site.get_app_list(request)
+            assert len([x for x in app_list if x["name"] == "Test_App"]) == 1
+
+    class TestCaseOverriddenInstancePermission:
+        @pytest.fixture
+        def view_to_register(self):
+            return OverriddenPermissionView
+
+        @pytest.mark.django_db
+        def test_it_uses_instance_permission(self, user, app_view):
+            request_factory = RequestFactory()
+            request = request_factory.get(reverse("admin:index"))
+            request.user = user
+
+            app_list = admin.site.get_app_list(request)
+            assert len([x for x in app_list if x["name"] == "Test_App"]) == 0
+
+    class TestCaseHasPermBackend:
+        @pytest.fixture
+        def permission(self):
+            return None
+
+        @pytest.fixture(autouse=True)
+        def backends(self, settings):
+            settings.AUTHENTICATION_BACKENDS = [
+                f"{__name__}.RuleBackend",
+                "django.contrib.auth.backends.ModelBackend",
+            ]
+
+        @pytest.mark.django_db
+        def test_it_shows_if_backend_grants_permission(self, user, app_view):
+            request_factory = RequestFactory()
+            request = request_factory.get(reverse("admin:index"))
+            request.user = user
+
+            assert AnExampleAppView().user_has_permission(user)
+            app_list = admin.site.get_app_list(request)
+            test_app = [x for x in app_list if x["name"] == "Test_App"][0]
+            assert [x["name"] for x in test_app["models"]] == ["Test App View"]
+
+    class TestCaseMenuCache:
+        @pytest.fixture(autouse=True)
+        def menu_cache(self, settings):
+            settings.CUSTOM_ADMIN_MENU_CACHE = "default"
+            caches["default"].clear()
+            yield
+            caches["default"].clear()
+
+        @staticmethod
+        def get_test_app_views(user):
+            request_factory = RequestFactory()
+            request = request_factory.get(reverse("admin:index"))
+            request.user = User.objects.get(pk=user.pk)
+
+            app_list = admin.site.get_app_list(request)
+            return [
+                model["name"]
+                for app in app_list
+                if app["name"] == "Test_App"
+                for model in app["models"]
+            ]
+
+        @pytest.mark.django_db
+        def test_it_caches_across_requests(self, user, app_view):
+            with mock.patch.object(
+                admin.site,
+                "_get_user_permissions",
+                wraps=admin.site._get_user_permissions,
+            ) as get_user_permissions:
+                assert self.get_test_app_views(user) == ["Test App View"]
+                assert self.get_test_app_views(user) == ["Test App View"]
+            assert get_user_permissions.call_count == 1
+
+        @pytest.mark.django_db
+        def test_it_invalidates_on_user_permission_change(
+            self, user, permission, app_view
+        ):
+            assert self.get_test_app_views(user) == ["Test App View"]
+            user.user_permissions.remove(permission)
+            assert self.get_test_app_views(user) == []
+
+        @pytest.mark.django_db
+        def test_it_invalidates_on_group_change(self, user, permission, app_view):
+            user.user_permissions.clear()
+            group = Group.objects.create(name="Test Group")
+            user.groups.add(group)
+            assert self.get_test_app_views(user) == []
+
+            group.permissions.add(permission)
+            assert self.get_test_app_views(user) == ["Test App View"]
+
+        @pytest.mark.django_db
+        def test_it_is_disabled_without_setting(self, user, app_view, settings):
+            settings.CUSTOM_ADMIN_MENU_CACHE = None
+            with mock.patch.object(
+                admin.site,
+                "_get_user_permissions",
+                wraps=admin.site._get_user_permissions,
+            ) as get_user_permissions:
+                self.get_test_app_views(user)
+                self.get_test_app_views(user)
+            assert get_user_permissions.call_count == 2
+
     class TestCaseInactiveUser:
         @pytest.fixture
         def active(self):
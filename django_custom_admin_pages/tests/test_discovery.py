@@ -0,0 +1,76 @@
+import sys
+from io import StringIO
+from unittest import mock
+
+from django.apps import apps
+from django.contrib import admin
+from django.core.management import call_command
+
+from .. import discovery
+from ..discovery import ModuleTiming, autodiscover
+
+
+class TestAutodiscover:
+    def test_it_imports_app_modules(self):
+        with mock.patch.object(discovery, "module_timings", []) as module_timings:
+            timings = autodiscover("models")
+
+        assert timings == module_timings
+        assert [timing.app_label for timing in timings] == [
+            "auth",
+            "contenttypes",
+            "sessions",
+            "admin",
+            "test_app",
+            "another_test_app",
+        ]
+        assert timings[4].module == "test_app.models"
+        assert all(timing.seconds >= 0 for timing in timings)
+
+    def test_it_skips_apps_without_module(self):
+        assert autodiscover("no_such_module") == []
+
+    def call_ready(self):
+        sys.modules.pop("test_app.admin_views", None)
+        with mock.patch.object(discovery, "module_timings", []) as module_timings:
+            apps.get_app_config("django_custom_admin_pages").ready()
+        return module_timings
+
+    def test_ready_imports_admin_views(self, settings):
+        settings.CUSTOM_ADMIN_AUTODISCOVER = True
+        module_timings = self.call_ready()
+
+        view = sys.modules["test_app.admin_views"].DiscoveredView
+        try:
+            assert admin.site.is_view_registered(view)
+        finally:
+            admin.site.unregister_view(view)
+        assert [timing.module for timing in module_timings] == ["test_app.admin_views"]
+
+    def test_it_is_off_by_default(self):
+        assert self.call_ready() == []
+        assert "test_app.admin_views" not in sys.modules
+
+
+class TestTimingsCommand:
+    def call_command(self, module_timings):
+        out = StringIO()
+        with mock.patch.object(discovery, "module_timings", module_timings):
+            call_command("custom_admin_timings", stdout=out)
+        return out.getvalue().splitlines()
+
+    def test_it_lists_slowest_first(self):
+        lines = self.call_command(
+            [
+                ModuleTiming("fast", "fast.admin_views", 0.001),
+                ModuleTiming("slow", "slow.admin_views", 0.25),
+            ]
+        )
+        assert lines == [
+            "slow.admin_views      250.0 ms",
+            "fast.admin_views        1.0 ms",
+            "Total                 251.0 ms",
+        ]
+
+    def test_without_modules(self):
+        assert self.call_command([]) == ["No admin_views modules were imported."]
@@ -0,0 +1,211 @@
+import logging
+import socket
+
+import django
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AbstractUser
+from django.test import RequestFactory
+from django.urls import reverse
+
+import pytest
+
+from ..admin import CustomAdminSite
+from ..instrumentation import (
+    DISPATCH,
+    MENU,
+    PERMISSION,
+    LoggingSink,
+    MemorySink,
+    StatsdSink,
+    Timing,
+    get_sinks,
+    record,
+    timing_recorded,
+)
+from ..views.performance_view import PerformanceView
+from .test_custom_admin_pages import AnAsyncView, AnExampleView, reload_urlconf
+
+User: AbstractUser = get_user_model()
+
+
+class BrokenSink:
+    def emit(self, timing):
+        raise ValueError("broken sink")
+
+
+@pytest.fixture
+def timings():
+    received = []
+
+    def receiver(timing, **kwargs):
+        received.append(timing)
+
+    timing_recorded.connect(receiver)
+    yield received
+    timing_recorded.disconnect(receiver)
+
+
+@pytest.fixture
+def instrumented(settings):
+    settings.CUSTOM_ADMIN_INSTRUMENTATION = True
+    settings.CUSTOM_ADMIN_INSTRUMENTATION_SINKS = [
+        "django_custom_admin_pages.instrumentation.MemorySink",
+        "django_custom_admin_pages.instrumentation.SignalSink",
+        "django_custom_admin_pages.tests.test_instrumentation.BrokenSink",
+    ]
+    get_sinks()[0].reset()
+
+
+@pytest.fixture
+def views():
+    admin.site.register_view([AnExampleView, PerformanceView])
+    reload_urlconf()
+    yield
+    admin.site.unregister_view([AnExampleView, PerformanceView])
+
+
+@pytest.fixture
+def superuser():
+    return User.objects.create(
+        username="Julian", is_staff=True, is_active=True, is_superuser=True
+    )
+
+
+class TestMeasurements:
+    @pytest.mark.django_db
+    def test_it_measures_dispatch(
+        self, instrumented, views, timings, client, superuser
+    ):
+        client.force_login(superuser)
+        r = client.get(reverse("admin:test_route"))
+        assert r.status_code == 200
+
+        by_metric = {(timing.metric, timing.target): timing for timing in timings}
+        assert set(by_metric) == {
+            (PERMISSION, "test_route"),
+            (MENU, "admin"),
+            (DISPATCH, "test_route"),
+        }
+        dispatch = by_metric[(DISPATCH, "test_route")]
+        # the dispatch time includes the menu, which is built while rendering
+        assert dispatch.seconds >= by_metric[(MENU, "admin")].seconds
+        assert dispatch.queries >= 1
+
+    @pytest.mark.django_db
+    def test_it_leaves_rendering_to_the_handler(
+        self, instrumented, views, timings, superuser
+    ):
+        request = RequestFactory().get(reverse("admin:test_route"))
+        request.user = superuser
+        response = AnExampleView.as_view()(request)
+        assert not response.is_rendered
+        assert DISPATCH not in [timing.metric for timing in timings]
+
+        # like process_template_response middleware
+        response.context_data["title"] = "Changed by middleware"
+        response.render()
+        assert b"Changed by middleware" in response.content
+        assert [timing.metric for timing in timings][-1] == DISPATCH
+
+    @pytest.mark.django_db
+    @pytest.mark.skipif(django.VERSION < (4, 1), reason="async views need 4.1+")
+    def test_it_measures_async_dispatch(self, instrumented, timings, client, superuser):
+        admin.site.register_view(AnAsyncView)
+        reload_urlconf()
+        try:
+            client.force_login(superuser)
+            r = client.get(reverse("admin:async_view"))
+        finally:
+            admin.site.unregister_view(AnAsyncView)
+        assert r.status_code == 200
+
+        by_metric = {(timing.metric, timing.target): timing for timing in timings}
+        assert {(PERMISSION, "async_view"), (DISPATCH, "async_view")} <= set(by_metric)
+        # queries of async views run in other threads and aren't counted
+        assert by_metric[(DISPATCH, "async_view")].queries is None
+        assert by_metric[(PERMISSION, "async_view")].queries is None
+
+    @pytest.mark.django_db
+    def test_it_is_off_by_default(self, views, timings, client, superuser):
+        client.force_login(superuser)
+        client.get(reverse("admin:test_route"))
+        assert timings == []
+
+
+class TestSinks:
+    timing = Timing(DISPATCH, "some:route", 0.0125, 3)
+
+    def test_memory_sink(self):
+        sink = MemorySink()
+        sink.emit(self.timing)
+        sink.emit(self.timing._replace(seconds=0.0375, queries=1))
+        [stats] = sink.get_stats()
+        assert (stats.metric, stats.target, stats.count) == (DISPATCH, "some:route", 2)
+        assert stats.average_ms == pytest.approx(25)
+        assert stats.max_ms == pytest.approx(37.5)
+        assert stats.average_queries == 2
+
+    def test_memory_sink_without_queries(self):
+        sink = MemorySink()
+        sink.emit(self.timing._replace(queries=None))
+        [stats] = sink.get_stats()
+        assert stats.average_queries is None
+
+    def test_logging_sink(self, caplog):
+        with caplog.at_level(logging.INFO):
+            LoggingSink().emit(self.timing)
+            LoggingSink().emit(self.timing._replace(queries=None))
+        assert caplog.messages == [
+            "dispatch some:route took 12.5 ms with 3 queries",
+            "dispatch some:route took 12.5 ms",
+        ]
+
+    def test_statsd_sink(self, settings):
+        server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        server.bind(("127.0.0.1", 0))
+        server.settimeout(5)
+        settings.CUSTOM_ADMIN_STATSD_PORT = server.getsockname()[1]
+        try:
+            StatsdSink().emit(self.timing)
+            data = server.recv(1024)
+        finally:
+            server.close()
+        assert data == (
+            b"custom_admin.dispatch.some_route:12.500|ms\n"
+            b"custom_admin.dispatch.some_route.queries:3|c"
+        )
+
+    def test_statsd_sink_without_queries(self):
+        assert StatsdSink().format(self.timing._replace(queries=None)) == (
+            b"custom_admin.dispatch.some_route:12.500|ms"
+        )
+
+    def test_broken_sink_is_logged(self, instrumented, timings, caplog):
+        record(self.timing)
+        assert timings == [self.timing]
+        assert "broken sink" in caplog.text
+
+
+class TestPerformanceView:
+    def test_it_is_registered_when_instrumented(self, instrumented):
+        assert CustomAdminSite(name="instrumented").is_view_registered(PerformanceView)
+
+    def test_it_is_not_registered_by_default(self):
+        assert not CustomAdminSite(name="plain").is_view_registered(PerformanceView)
+
+    @pytest.mark.django_db
+    def test_it_shows_stats(self, instrumented, views, client, superuser):
+        client.force_login(superuser)
+        client.get(reverse("admin:test_route"))
+        r = client.get(reverse("admin:custom_admin_performance"))
+        assert r.status_code == 200
+        stats = {(stat.metric, stat.target) for stat in r.context["stats"]}
+        assert (DISPATCH, "test_route") in stats
+        assert b"test_route" in r.content
+
+    @pytest.mark.django_db
+    def test_it_is_superuser_only(self, views, client):
+        client.force_login(User.objects.create(username="Bill", is_staff=True))
+        r = client.get(reverse("admin:custom_admin_performance"))
+        assert r.status_code == 403
@@ -0,0 +1,209 @@
+import time
+
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AbstractUser
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+
+import pytest
+
+from ..jobs import (
+    FAILURE,
+    PENDING,
+    SUCCESS,
+    JobExecutor,
+    ThreadJobExecutor,
+    get_job_status,
+    run_job,
+    submit_job,
+)
+from ..views.admin_job_view import AdminJobStatusView, AdminJobView
+from .test_custom_admin_pages import reload_urlconf
+
+User: AbstractUser = get_user_model()
+
+
+def count_to(progress, n, message=""):
+    for i in range(n):
+        progress.update(i + 1, total=n, message=message)
+    return n
+
+
+def fail(progress):
+    raise ValueError("job failed")
+
+
+class InlineJobExecutor(JobExecutor):
+    "runs jobs while they are submitted"
+
+    def submit(self, job_id, func_path, args, kwargs):
+        run_job(job_id, func_path, args, kwargs)
+
+
+class QueuedJobExecutor(JobExecutor):
+    "keeps jobs without running them"
+
+    jobs = []
+
+    def submit(self, job_id, func_path, args, kwargs):
+        self.jobs.append((job_id, func_path, args, kwargs))
+
+
+class CountJobView(AdminJobView):
+    view_name = "Count"
+    route_name = "count_job"
+    app_label = "test_app"
+    permission_required = "test_app.test_perm"
+    job_function = count_to
+
+    def get_job_arguments(self):
+        return (3,), {"message": self.request.POST.get("message", "")}
+
+
+class FailingJobView(AdminJobView):
+    view_name = "Failing Job"
+    route_name = "failing_job"
+    job_function = "django_custom_admin_pages.tests.test_jobs.fail"
+
+
+def wait_for_job(job_id, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = get_job_status(job_id)
+        if status.state in (SUCCESS, FAILURE):
+            return status
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+@pytest.fixture
+def job_views():
+    admin.site.register_view([CountJobView, FailingJobView])
+    reload_urlconf()
+    yield
+    admin.site.unregister_view([CountJobView, FailingJobView])
+
+
+@pytest.fixture
+def super_client(client):
+    client.force_login(
+        User.objects.create(
+            username="Julian", is_staff=True, is_active=True, is_superuser=True
+        )
+    )
+    return client
+
+
+@pytest.fixture
+def inline_executor(settings):
+    settings.CUSTOM_ADMIN_JOB_EXECUTOR = (
+        "django_custom_admin_pages.tests.test_jobs.InlineJobExecutor"
+    )
+
+
+class TestSubmitJob:
+    def test_it_runs_in_a_thread(self):
+        job_id = submit_job(count_to, 2)
+        status = wait_for_job(job_id)
+        assert status.result == 2
+        assert (status.done, status.total) == (2, 2)
+
+    def test_it_stores_errors(self):
+        status = wait_for_job(submit_job(fail))
+        assert status.state == FAILURE
+        assert status.error == "job failed"
+
+    def test_it_uses_configured_executor(self, settings):
+        settings.CUSTOM_ADMIN_JOB_EXECUTOR = (
+            "django_custom_admin_pages.tests.test_jobs.QueuedJobExecutor"
+        )
+        job_id = submit_job(count_to, 1, message="hi")
+        assert QueuedJobExecutor.jobs[-1] == (
+            job_id,
+            "django_custom_admin_pages.tests.test_jobs.count_to",
+            (1,),
+            {"message": "hi"},
+        )
+        assert get_job_status(job_id).state == PENDING
+
+    def test_it_rejects_nested_functions(self):
+        def nested(progress):
+            pass
+
+        with pytest.raises(ImproperlyConfigured):
+            submit_job(nested)
+
+    def test_default_executor(self):
+        from ..jobs import get_job_executor
+
+        assert isinstance(get_job_executor(), ThreadJobExecutor)
+        assert get_job_executor() is get_job_executor()
+
+
+class TestAdminJobView:
+    def test_status_view_is_registered(self, job_views):
+        status_view = CountJobView.get_status_view()
+        assert admin.site.is_view_registered(status_view)
+        assert status_view.route_path == "count/<str:job_id>/"
+        assert status_view.app_label == "test_app"
+
+    def test_status_view_is_unregistered(self, job_views):
+        admin.site.unregister_view(CountJobView)
+        assert not admin.site.is_view_registered(CountJobView.get_status_view())
+        admin.site.register_view(CountJobView)
+
+    @pytest.mark.django_db
+    def test_start_and_status(self, job_views, inline_executor, super_client):
+        r = super_client.get(reverse("admin:count_job"))
+        assert r.status_code == 200
+        assert r.context["title"] == "Count"
+
+        r = super_client.post(reverse("admin:count_job"), {"message": "counting"})
+        assert r.status_code == 302
+        job_id = r.url.rstrip("/").rsplit("/", 1)[1]
+        assert r.url == reverse("admin:count_job_status", kwargs={"job_id": job_id})
+
+        r = super_client.get(r.url)
+        assert r.status_code == 200
+        assert r.context["job"].state == SUCCESS
+        assert not r.context["job_running"]
+        assert b'<progress value="3" max="3">' in r.content
+        assert b"counting" in r.content
+
+        r = super_client.get(r.request["PATH_INFO"], {"format": "json"})
+        assert r.json()["result"] == 3
+
+    @pytest.mark.django_db
+    def test_failed_job_status(self, job_views, inline_executor, super_client):
+        r = super_client.post(reverse("admin:failing_job"))
+        r = super_client.get(r.url)
+        assert r.context["job"].state == FAILURE
+        assert b"job failed" in r.content
+
+    @pytest.mark.django_db
+    def test_unknown_job(self, job_views, super_client):
+        r = super_client.get(
+            reverse("admin:count_job_status", kwargs={"job_id": "unknown"})
+        )
+        assert r.status_code == 404
+
+    @pytest.mark.django_db
+    def test_status_requires_job_permission(self, job_views, client):
+        client.force_login(User.objects.create(username="Bill", is_staff=True))
+        job_id = submit_job(count_to, 1)
+        r = client.get(reverse("admin:count_job_status", kwargs={"job_id": job_id}))
+        assert r.status_code == 403
+
+    def test_status_view_requires_job_view(self):
+        with pytest.raises(ImproperlyConfigured):
+            AdminJobStatusView().user_has_permission(User(is_staff=True))
+
+    @pytest.mark.django_db
+    def test_status_view_is_not_in_menu(self, job_views, super_client):
+        r = super_client.get(reverse("admin:index"))
+        names = [
+            model["name"] for app in r.context["app_list"] for model in app["models"]
+        ]
+        assert "Count" in names
+        assert "Count status" not in names
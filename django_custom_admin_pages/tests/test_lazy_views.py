@@ -0,0 +1,116 @@
+import sys
+
+from django.apps import apps
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AbstractUser
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+
+import pytest
+
+from ..views.lazy_admin_view import LazyAdminView, make_lazy_view
+from .test_custom_admin_pages import reload_urlconf
+
+User: AbstractUser = get_user_model()
+
+LAZY_VIEWS_MODULE = "django_custom_admin_pages.tests.lazy_views"
+MANIFEST = [
+    {
+        "view_path": f"{LAZY_VIEWS_MODULE}.LazyReportView",
+        "view_name": "Lazy Report",
+        "app_label": "test_app",
+        "route_name": "lazy_report",
+        "permission_required": "test_app.test_perm",
+    }
+]
+
+
+@pytest.fixture
+def lazy_view():
+    sys.modules.pop(LAZY_VIEWS_MODULE, None)
+    view = admin.site.register_lazy_view(**MANIFEST[0])
+    reload_urlconf()
+    yield view
+    admin.site.unregister_view(view)
+
+
+def menu_names(client):
+    r = client.get(reverse("admin:index"))
+    return [model["name"] for app in r.context["app_list"] for model in app["models"]]
+
+
+class TestLazyRegistration:
+    @pytest.mark.django_db
+    def test_it_imports_on_first_dispatch(self, lazy_view, client):
+        client.force_login(
+            User.objects.create(
+                username="Julian", is_staff=True, is_active=True, is_superuser=True
+            )
+        )
+        assert "Lazy Report" in menu_names(client)
+        assert LAZY_VIEWS_MODULE not in sys.modules
+
+        r = client.get(reverse("admin:lazy_report"))
+        assert r.status_code == 200
+        assert LAZY_VIEWS_MODULE in sys.modules
+        assert lazy_view.get_view() is sys.modules[LAZY_VIEWS_MODULE].LazyReportView
+
+    @pytest.mark.django_db
+    def test_imported_view_checks_permission(self, lazy_view, client):
+        client.force_login(User.objects.create(username="Bill", is_staff=True))
+        assert "Lazy Report" not in menu_names(client)
+        assert LAZY_VIEWS_MODULE not in sys.modules
+
+        r = client.get(reverse("admin:lazy_report"))
+        assert r.status_code == 403
+
+    def test_it_sets_defaults(self, lazy_view):
+        assert issubclass(lazy_view, LazyAdminView)
+        assert lazy_view.route_path == "lazy-report"
+        assert admin.site.get_registered_view("lazy_report") is lazy_view
+
+    def test_it_validates_app_label(self):
+        with pytest.raises(ImproperlyConfigured):
+            admin.site.register_lazy_view(
+                f"{LAZY_VIEWS_MODULE}.LazyReportView", "Lazy Report", app_label="nope"
+            )
+
+    def test_it_rejects_other_views(self):
+        view = make_lazy_view("django.views.generic.TemplateView", "Template")
+        with pytest.raises(ImproperlyConfigured):
+            view.get_view()
+
+    @pytest.mark.django_db
+    def test_imported_view_gets_route(self, client):
+        view = admin.site.register_lazy_view(
+            f"{LAZY_VIEWS_MODULE}.LazyExportView",
+            "Lazy Export",
+            app_label="test_app",
+            route_name="lazy_export",
+        )
+        reload_urlconf()
+        try:
+            client.force_login(
+                User.objects.create(username="Julian", is_staff=True, is_superuser=True)
+            )
+            r = client.get(reverse("admin:lazy_export"))
+        finally:
+            admin.site.unregister_view(view)
+        assert r.status_code == 200
+        assert r["Content-Disposition"] == 'attachment; filename="lazy_export.csv"'
+
+    def test_it_rejects_views_with_extra_views(self):
+        view = make_lazy_view(f"{LAZY_VIEWS_MODULE}.LazyJobView", "Lazy Job")
+        with pytest.raises(ImproperlyConfigured):
+            view.get_view()
+
+    def test_manifest_setting(self, settings):
+        settings.CUSTOM_ADMIN_VIEWS = MANIFEST
+        sys.modules.pop(LAZY_VIEWS_MODULE, None)
+        apps.get_app_config("django_custom_admin_pages").ready()
+        view = admin.site.get_registered_view("lazy_report")
+        admin.site.unregister_view(view)
+
+        assert view.view_path == MANIFEST[0]["view_path"]
+        assert LAZY_VIEWS_MODULE not in sys.modules
@@ -0,0 +1,241 @@
+import random
+import time
+import tracemalloc
+from types import SimpleNamespace
+from unittest import mock
+
+from django.apps import apps
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AbstractUser, Permission
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.views.generic import TemplateView
+
+import pytest
+from test_app.models import SomeModel
+
+from ..admin import CustomAdminSite, get_installed_apps, merge_sorted, model_sort_key
+from ..checks import get_missing_permissions
+from ..views.admin_base_view import AdminBaseView
+from ..views.admin_export_view import AdminExportView
+from .test_custom_admin_pages import reload_urlconf
+
+User: AbstractUser = get_user_model()
+
+
+@pytest.fixture
+def superuser():
+    return User.objects.create(
+        username="Julian", is_staff=True, is_active=True, is_superuser=True
+    )
+
+
+def make_views(count, prefix, app_label="test_app"):
+    """
+    Creates ``count`` distinct view classes, each requiring its own permission.
+    """
+    return [
+        type(
+            f"{prefix.title()}View{i}",
+            (AdminBaseView, TemplateView),
+            {
+                "view_name": f"{prefix} view {i}",
+                "route_name": f"{prefix}_route_{i}",
+                "app_label": app_label,
+                "template_name": "base_custom_admin.html",
+                "permission_required": (f"test_app.{prefix}_perm_{i}",),
+            },
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def content_type():
+    return ContentType.objects.get(app_label="test_app", model="somemodel")
+
+
+def measure_app_list(views, content_type):
+    """
+    Registers views, grants a new staff user every other view's permission and
+    returns the visible view names and number of queries to build the app_list.
+    """
+    user = User.objects.create(
+        username=f"staff{len(views)}", password="staffpw", is_staff=True
+    )
+    for view in views[::2]:
+        user.user_permissions.add(
+            Permission.objects.create(
+                name=view.view_name,
+                codename=view.permission_required[0].split(".")[1],
+                content_type=content_type,
+            )
+        )
+
+    admin.site.register_view(views)
+    reload_urlconf()
+    try:
+        admin.site._get_menu_index()  # build outside of the measured request
+        request = RequestFactory().get(reverse("admin:index"))
+        request.user = User.objects.get(pk=user.pk)
+        with CaptureQueriesContext(connection) as queries:
+            app_list = admin.site.get_app_list(request)
+    finally:
+        admin.site.unregister_view(views)
+
+    test_app = [x for x in app_list if x["app_label"] == "test_app"][0]
+    return {x["name"] for x in test_app["models"]}, len(queries)
+
+
+class TestPermissionResolution:
+    @pytest.mark.django_db
+    def test_queries_are_flat_in_number_of_views(self, content_type, monkeypatch):
+        def fail_has_perms(*args, **kwargs):
+            raise AssertionError("has_perms should not be called per view")
+
+        monkeypatch.setattr(User, "has_perms", fail_has_perms)
+
+        query_counts = []
+        for count in (10, 200):
+            views = make_views(count, f"bench{count}")
+            visible, query_count = measure_app_list(views, content_type)
+            assert visible == {view.view_name for view in views[::2]}
+            query_counts.append(query_count)
+
+        assert query_counts[0] == query_counts[1]
+
+
+class TestInstalledAppIndex:
+    @pytest.fixture
+    def many_apps(self):
+        """
+        Adds 200 fake app configs to the app registry.
+        """
+        app_configs = dict(apps.app_configs)
+        for i in range(200):
+            label = f"bench_app_{i}"
+            app_configs[label] = SimpleNamespace(
+                name=label, label=label, verbose_name=label.title()
+            )
+        with mock.patch.object(apps, "app_configs", app_configs):
+            yield [f"bench_app_{i}" for i in range(200)]
+
+    def test_registration_reads_app_registry_once(self, many_apps):
+        site = CustomAdminSite(name="benchmark")
+        views = [
+            view
+            for i, app_label in enumerate(many_apps)
+            for view in make_views(5, f"registration{i}", app_label=app_label)
+        ]
+
+        with mock.patch.object(
+            apps, "get_app_configs", wraps=apps.get_app_configs
+        ) as get_app_configs:
+            site.register_view(views)
+
+        assert len(site._view_registry) == 1000
+        assert get_app_configs.call_count == 1
+        assert len(site._view_registry.get_by_app_label("bench_app_199")) == 5
+
+    def test_index_is_rebuilt_when_registry_changes(self, many_apps):
+        assert "bench_app_0" in get_installed_apps()
+        with mock.patch.object(apps, "app_configs", {}):
+            assert "bench_app_0" not in get_installed_apps()
+            assert "test_app" not in get_installed_apps()
+
+
+class TestModelMerge:
+    @staticmethod
+    def make_models(count, prefix):
+        names = [f"{prefix} {random.random()}" for _ in range(count)]
+        return [{"name": name} for name in sorted(names)]
+
+    @staticmethod
+    def sort_per_append(models, custom_models):
+        "previous approach: sort the app's models after every appended view"
+        models = list(models)
+        for custom_model in custom_models:
+            models.append(custom_model)
+            models.sort(key=model_sort_key)
+        return models
+
+    @staticmethod
+    def best_time(func, *args):
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            func(*args)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    def test_merge_is_sorted_and_faster(self):
+        models = self.make_models(300, "Model")
+        custom_models = self.make_models(300, "View")
+
+        merged = merge_sorted(models, custom_models, model_sort_key)
+        assert merged == sorted(models + custom_models, key=model_sort_key)
+        assert merged == self.sort_per_append(models, custom_models)
+
+        assert self.best_time(
+            merge_sorted, models, custom_models, model_sort_key
+        ) < self.best_time(self.sort_per_append, models, custom_models)
+
+
+class TestPermissionCheck:
+    @pytest.mark.django_db
+    def test_it_uses_one_query(self, content_type):
+        views = make_views(1000, "check")
+        Permission.objects.bulk_create(
+            Permission(
+                name=view.view_name,
+                codename=view.permission_required[0].split(".")[1],
+                content_type=content_type,
+            )
+            for view in views[1:]
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            missing = get_missing_permissions(views, "default")
+
+        assert len(queries) == 1
+        assert missing == {"test_app.check_perm_0": [views[0]]}
+
+
+class TestExportMemory:
+    class ExportView(AdminExportView):
+        view_name = "Memory Export"
+        route_name = "memory_export"
+        model = SomeModel
+        chunk_size = 500
+
+    def measure_export(self, superuser):
+        """
+        Returns the number of exported lines and the peak memory allocated while
+        streaming the export.
+        """
+        request = RequestFactory().get("/")
+        request.user = superuser
+        tracemalloc.start()
+        try:
+            response = self.ExportView.as_view()(request)
+            lines = sum(chunk.count(b"\n") for chunk in response.streaming_content)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return lines, peak
+
+    @pytest.mark.django_db
+    def test_memory_is_bounded(self, superuser):
+        SomeModel.objects.bulk_create(SomeModel() for _ in range(5000))
+        small_lines, small_peak = self.measure_export(superuser)
+        SomeModel.objects.bulk_create(SomeModel() for _ in range(45000))
+        large_lines, large_peak = self.measure_export(superuser)
+
+        assert small_lines == 5001
+        assert large_lines == 50001
+        # 10 times the rows must not need much more memory
+        assert large_peak < small_peak * 2
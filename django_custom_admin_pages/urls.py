@@ -1,31 +1,74 @@
-from typing import TYPE_CHECKING
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Iterable, List
 
-from django.conf import settings
-from django.urls import path
+from django.urls import Resolver404, URLResolver, path
+from django.urls.resolvers import RoutePattern
 from django.utils.text import get_valid_filename, slugify
 
+from .app_settings import app_settings
+
 if TYPE_CHECKING:
     from .views import AdminBaseView
 
 
-urlpatterns = []
+class AppLabelURLResolver(URLResolver):
+    """
+    Resolves custom admin view urls by looking up the resolver for the first path
+    segment (the app_label) in a dict, instead of trying each app's urls in turn.
+    Unmatched paths raise Resolver404 straight away so the admin site can fall through
+    to its ModelAdmin urls. Reversing works like a regular include().
+    """
+
+    def __init__(self, app_resolvers: Dict[str, URLResolver]):
+        super().__init__(RoutePattern(""), list(app_resolvers.values()))
+        self._app_resolvers = app_resolvers
 
+    def resolve(self, url_path):  # pylint: disable=arguments-renamed
+        url_path = str(url_path)  # url_path may be a reverse_lazy object
+        resolver = self._app_resolvers.get(url_path.partition("/")[0])
+        if resolver is None:
+            raise Resolver404({"path": url_path})
+        try:
+            match = resolver.resolve(url_path)
+        except Resolver404 as e:
+            tried = [[resolver, *t] for t in e.args[0].get("tried") or [[]]]
+            raise Resolver404({"tried": tried, "path": url_path}) from e
+        # the app resolver's own prefix isn't part of its match's route
+        match.route = self._join_route(str(resolver.pattern), match.route)
+        return match
 
-def add_view_to_conf(view: "AdminBaseView"):
-    global urlpatterns  # pylint: disable=global-statement
 
+def set_view_defaults(view: "AdminBaseView"):
+    "sets default app_label, route_path and route_name on view if unset"
     if not view.app_label:
-        view.app_label = settings.CUSTOM_ADMIN_DEFAULT_APP_LABEL
+        view.app_label = app_settings.CUSTOM_ADMIN_DEFAULT_APP_LABEL
     if not view.route_path:
         view.route_path = slugify(view.view_name).lower()
 
     if not view.route_name:
         view.route_name = get_valid_filename(view.view_name).lower()
 
-    urlpatterns += [
-        path(
-            f"{view.app_label}/{view.route_path}",
-            view.as_view(),
-            name=view.route_name,
+
+def build_urlpatterns(views: Iterable["AdminBaseView"]) -> List[URLResolver]:
+    """
+    Builds the url patterns for views in one pass, grouped by app_label. Called by
+    CustomAdminSite.get_urls so the patterns always match the views registered when
+    the url conf loads.
+    """
+    patterns_by_app = defaultdict(list)
+    for view in views:
+        patterns_by_app[view.app_label].append(
+            path(view.route_path, view.as_view(), name=view.route_name)
+        )
+
+    if not patterns_by_app:
+        return []
+
+    return [
+        AppLabelURLResolver(
+            {
+                app_label: URLResolver(RoutePattern(f"{app_label}/"), patterns)
+                for app_label, patterns in patterns_by_app.items()
+            }
         )
     ]
@@ -1 +1,5 @@
-from .admin_base_view import AdminBaseView
+from .admin_base_view import AdminBaseView, ContextLoader
+from .admin_export_view import AdminExportView
+from .admin_job_view import AdminJobView
+from .async_admin_base_view import AsyncAdminBaseView, AsyncAdminTemplateView
+from .lazy_admin_view import LazyAdminView
@@ -1,17 +1,73 @@
-from typing import TYPE_CHECKING, Iterable, Optional
+import contextvars
+import datetime
+import logging
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, AbstractSet, Any, Dict, Iterable, Optional, Type
 
 from django.contrib import admin
 from django.contrib.auth.mixins import PermissionRequiredMixin
 from django.core.exceptions import ImproperlyConfigured
-from django.utils.decorators import method_decorator
+from django.db import connections
+from django.urls import get_script_prefix, get_urlconf, set_script_prefix, set_urlconf
+from django.utils import timezone, translation
+from django.utils.cache import (
+    add_never_cache_headers,
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date, quote_etag
 from django.views import View
-from django.views.decorators.cache import never_cache
+
+from ..app_settings import app_settings
+from ..cache import ContentCache
+from ..instrumentation import DISPATCH, PERMISSION, Measurement, measure
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractBaseUser
+    from django.http import HttpRequest, HttpResponse
+
+logger = logging.getLogger(__name__)
+
+NEVER_CACHE = "never"
+PRIVATE_CACHE = "private"
+
+ContextLoader = namedtuple(
+    "ContextLoader", ["name", "method", "timeout", "default"], defaults=[None, None]
+)
+
+RequestState = namedtuple(
+    "RequestState", ["language", "timezone", "urlconf", "script_prefix"]
+)
+
+
+def get_request_state() -> RequestState:
+    "returns the active language, timezone, urlconf and script prefix"
+    return RequestState(
+        translation.get_language(),
+        timezone.get_current_timezone(),
+        get_urlconf(),
+        get_script_prefix(),
+    )
+
+
+def set_request_state(state: RequestState):
+    """
+    Activates a RequestState in another thread. Recent asgiref versions don't share
+    the storage of these settings with threads that asgiref didn't start, even when
+    run in a copy of the request's context.
+    """
+    if state.language is None:
+        translation.deactivate_all()
+    else:
+        translation.activate(state.language)
+    timezone.activate(state.timezone)
+    set_urlconf(state.urlconf)
+    set_script_prefix(state.script_prefix)
 
 
-@method_decorator(never_cache, name="dispatch")
 class AdminBaseView(PermissionRequiredMixin, View):
     """
     Base class for custom admin views
@@ -47,6 +103,60 @@ class AdminBaseView(PermissionRequiredMixin, View):
 
         :type: [str] or none
         :default: none
+
+    :cvar show_in_menu:
+        Whether the view is listed in the admin menu
+
+        :type: bool
+        :default: True
+
+    :cvar cache_policy:
+        How responses may be cached. ``"never"`` disables caching. ``"private"`` lets the browser
+        cache for cache_max_age seconds and answers conditional GETs with 304 using get_etag
+        and get_last_modified.
+
+        :type: str
+        :default: "never"
+
+    :cvar cache_max_age:
+        Seconds a response may be cached with the "private" cache_policy
+
+        :type: int
+        :default: 0
+
+    :cvar content_cache_timeout:
+        Seconds to cache the page content wrapped in the ``custom_admin_cache`` template tag, shared by
+        users with the same permissions. Only used by GET and HEAD requests. None disables the content cache.
+
+        :type: int or none
+        :default: none
+
+    :cvar content_cache_alias:
+        The cache in settings.CACHES to store page content in
+
+        :type: str
+        :default: "default"
+
+    :cvar content_cache_lock_timeout:
+        Seconds other requests wait for the content while one request renders it
+
+        :type: int
+        :default: 10
+
+    :cvar context_loaders:
+        ContextLoader(name, method, timeout=None, default=None) tuples. The view methods named by method are
+        called concurrently and their results are added to the context under name. A loader that raises or
+        takes longer than timeout seconds gets default instead and its error is added to
+        context["context_loader_errors"].
+
+        :type: tuple[ContextLoader]
+        :default: ()
+
+    :cvar context_loader_max_workers:
+        Maximum number of threads used to run context_loaders
+
+        :type: int
+        :default: 8
     """
 
     view_name: str = None  # Display name for view in admin menu
@@ -58,25 +168,200 @@ class AdminBaseView(PermissionRequiredMixin, View):
     ] = None  # The slug for the path to be created, defaults to view name
     permission_required = ()
     app_label: Optional[str] = None  # Must match app label in settings or be None
+    show_in_menu: bool = True
+    cache_policy: str = NEVER_CACHE
+    cache_max_age: int = 0
+    content_cache_timeout: Optional[int] = None
+    content_cache_alias: str = "default"
+    content_cache_lock_timeout: int = 10
+    content_is_cached: bool = False  # set by get_context_data
+    context_loaders: Iterable[ContextLoader] = ()
+    context_loader_max_workers: int = 8
+    loaded_context: Optional[Dict[str, Any]] = None  # set by get_context_data
+    context_loader_errors: Optional[Dict[str, BaseException]] = None
+
+    def dispatch(self, request, *args, **kwargs):
+        if not app_settings.CUSTOM_ADMIN_INSTRUMENTATION:
+            return self._dispatch(request, *args, **kwargs)
+
+        measurement = Measurement(DISPATCH, self.route_name).start()
+        try:
+            response = self._dispatch(request, *args, **kwargs)
+        except BaseException:
+            measurement.stop()
+            raise
+        return self._stop_after_render(measurement, response)
+
+    @staticmethod
+    def _stop_after_render(measurement: Measurement, response: "HttpResponse"):
+        """
+        Stops measurement once response is rendered, so the measured time and queries
+        include template rendering, which happens after template response middleware.
+        """
+        if getattr(response, "is_rendered", True):
+            measurement.stop()
+        else:
+            response.add_post_render_callback(lambda response: measurement.stop())
+        return response
+
+    def _dispatch(self, request, *args, **kwargs):
+        with measure(PERMISSION, self.route_name):
+            has_permission = self.has_permission()
+        if not has_permission:
+            return self._permission_denied()
+
+        if self.cache_policy == NEVER_CACHE:
+            response = super(PermissionRequiredMixin, self).dispatch(
+                request, *args, **kwargs
+            )
+            add_never_cache_headers(response)
+            return response
+
+        self._check_cache_policy()
+        etag, last_modified = self._get_validators(request, *args, **kwargs)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = super(PermissionRequiredMixin, self).dispatch(
+                request, *args, **kwargs
+            )
+        return self._add_cache_headers(request, response, etag, last_modified)
+
+    def _permission_denied(self) -> "HttpResponse":
+        response = self.handle_no_permission()
+        add_never_cache_headers(response)
+        return response
+
+    @classmethod
+    def get_extra_views(cls) -> Iterable[Type["AdminBaseView"]]:
+        """
+        Override to return views that are registered and unregistered together with
+        this view. Called after the view's route defaults are set.
+        """
+        return ()
+
+    def _check_cache_policy(self):
+        if self.cache_policy not in (NEVER_CACHE, PRIVATE_CACHE):
+            raise ImproperlyConfigured(
+                f"{self.__class__.__name__}.cache_policy must be '{NEVER_CACHE}' or '{PRIVATE_CACHE}'"
+            )
+
+    def get_etag(self, request: "HttpRequest", *args, **kwargs) -> Optional[str]:
+        """
+        Override to return an ETag for the page with the "private" cache_policy.
+        """
+        return None
+
+    def get_last_modified(
+        self, request: "HttpRequest", *args, **kwargs
+    ) -> Optional[datetime.datetime]:
+        """
+        Override to return when the page last changed with the "private" cache_policy.
+        """
+        return None
+
+    def _get_validators(self, request, *args, **kwargs):
+        "returns quoted etag and last modified timestamp for safe requests"
+        if request.method not in ("GET", "HEAD"):
+            return None, None
+
+        # the hooks return None unless overridden
+        # pylint: disable=assignment-from-none
+        etag = self.get_etag(request, *args, **kwargs)
+        if etag is not None:
+            etag = quote_etag(etag)
+
+        last_modified = self.get_last_modified(request, *args, **kwargs)
+        # pylint: enable=assignment-from-none
+        if last_modified is not None:
+            if not timezone.is_aware(last_modified):
+                last_modified = timezone.make_aware(
+                    last_modified, datetime.timezone.utc
+                )
+            last_modified = int(last_modified.timestamp())
+
+        return etag, last_modified
+
+    def _add_cache_headers(
+        self,
+        request: "HttpRequest",
+        response: "HttpResponse",
+        etag: Optional[str],
+        last_modified: Optional[int],
+    ) -> "HttpResponse":
+        if request.method in ("GET", "HEAD"):
+            if etag and not response.has_header("ETag"):
+                response["ETag"] = etag
+            if last_modified and not response.has_header("Last-Modified"):
+                response["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(response, private=True, max_age=self.cache_max_age)
+        # admin pages depend on the logged in user
+        patch_vary_headers(response, ("Cookie",))
+        return response
 
     def has_permission(self):
         return self.user_has_permission(self.request.user)
 
     def user_has_permission(self, user: "AbstractBaseUser") -> bool:
         """
-        Used to check permission without instance.
+        Used to check permission without request.
+        """
+        return self._check_user_permission(user, self.get_permission_required())
+
+    @classmethod
+    def user_has_class_permission(
+        cls,
+        user: "AbstractBaseUser",
+        user_permissions: Optional[AbstractSet[str]] = None,
+    ) -> bool:
+        """
+        Used to check permission without instance. Falls back to instantiating the view
+        if user_has_permission or get_permission_required is overridden.
+
+        :param user: user to check
+        :param user_permissions: permissions already resolved for the user, checked
+            instead of calling user.has_perms()
+        """
+        if (
+            cls.user_has_permission is not AdminBaseView.user_has_permission
+            or cls.get_permission_required is not AdminBaseView.get_permission_required
+        ):
+            return cls().user_has_permission(user)
+
+        return cls._check_user_permission(
+            user,
+            cls.normalize_permission_required(cls.permission_required),
+            user_permissions,
+        )
+
+    @staticmethod
+    def _check_user_permission(
+        user: "AbstractBaseUser",
+        perms: Iterable[str],
+        user_permissions: Optional[AbstractSet[str]] = None,
+    ) -> bool:
+        has_permission = AdminBaseView._check_user_status(user, perms)
+        if has_permission is not None:
+            return has_permission
+        if user_permissions is not None:
+            return user_permissions.issuperset(perms)
+        return user.has_perms(perms)
+
+    @staticmethod
+    def _check_user_status(
+        user: "AbstractBaseUser", perms: Iterable[str]
+    ) -> Optional[bool]:
+        """
+        Decides permission from whether the user is active, a superuser or staff.
+        Returns None if the user is staff and perms have to be checked.
         """
         if not user.is_active:
             return False
-
         if user.is_superuser:
             return True
-
         if user.is_staff:
-            if perms := self.get_permission_required():
-                return user.has_perms(perms)
-            return True
-
+            return None if perms else True
         return False
 
     def get_permission_required(self):
@@ -84,23 +369,111 @@ class AdminBaseView(PermissionRequiredMixin, View):
             cls_name = self.__class__.__name__
             message = f"{cls_name} is missing the permission_required attribute. Define {cls_name}.permission_required, or override {cls_name}.get_permission_required()."
             raise ImproperlyConfigured(message)
-        if isinstance(self.permission_required, str):
-            perms = (self.permission_required,)
-        elif isinstance(self.permission_required, Iterable):
-            perms = self.permission_required
+        return self.normalize_permission_required(self.permission_required)
+
+    @classmethod
+    def normalize_permission_required(cls, permission_required) -> Iterable[str]:
+        """
+        Returns permission_required as an iterable of permission codenames.
+
+        :raise ValueError: If permission_required isn't a string or iterable.
+        """
+        if isinstance(permission_required, str):
+            perms = (permission_required,)
+        elif isinstance(permission_required, Iterable):
+            perms = permission_required
         else:
             raise ValueError(
-                f"{self.__class__.__name__}.permission_required must be a string or iterable"
+                f"{cls.__name__}.permission_required must be a string or iterable"
             )
         return perms
 
+    def get_content_cache_version(self) -> str:
+        """
+        Override to return a version that changes whenever cached content is outdated.
+        """
+        return ""
+
     def get_context_data(self, *args, **kwargs):
         """
-        adds admin site context
+        adds admin site context. If content_cache_timeout is set, looks up the cached
+        content of GET and HEAD requests and sets content_is_cached, so subclasses can
+        skip building context that is only used by the cached content.
         """
         admin_site = admin.site
         self.request.name = admin_site.name
         context: dict = admin_site.each_context(self.request)
+        # other requests may render forms or errors that can't be shared
+        safe_request = self.request.method in ("GET", "HEAD")
+        if self.content_cache_timeout is not None and safe_request:
+            content_cache = ContentCache.for_view(self)
+            self.content_is_cached = content_cache.content is not None
+            context["custom_admin_content_cache"] = content_cache
+        if self.context_loaders:
+            if self.loaded_context is None:
+                self.loaded_context = self.load_context()
+            context.update(self.loaded_context)
+            context["context_loader_errors"] = self.context_loader_errors
         if hasattr(super(), "get_context_data"):
             context.update(super().get_context_data(*args, **kwargs))
         return context
+
+    def load_context(self) -> Dict[str, Any]:
+        """
+        Runs context_loaders concurrently in a thread pool and returns their results by
+        name. Each loader runs in a copy of the current context with the active
+        language, timezone, urlconf and script prefix. Timeouts count from when loading
+        starts.
+        """
+        self.context_loader_errors = {}
+        loaders = list(self.context_loaders)
+        state = get_request_state()
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(loaders), self.context_loader_max_workers)
+        )
+        try:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._run_context_loader,
+                    loader,
+                    state,
+                )
+                for loader in loaders
+            ]
+            start = time.monotonic()
+            loaded = {}
+            for loader, future in zip(loaders, futures):
+                timeout = loader.timeout
+                if timeout is not None:
+                    timeout = max(0, start + timeout - time.monotonic())
+                try:
+                    loaded[loader.name] = future.result(timeout)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    future.cancel()
+                    loaded[loader.name] = self._context_loader_failed(loader, e)
+        finally:
+            # don't wait for loaders that timed out
+            executor.shutdown(wait=False)
+        return loaded
+
+    def _run_context_loader(
+        self, loader: ContextLoader, state: Optional[RequestState] = None
+    ):
+        "runs a loader in a worker thread, which gets its own database connections"
+        try:
+            if state is not None:
+                set_request_state(state)
+            return getattr(self, loader.method)()
+        finally:
+            connections.close_all()
+
+    def _context_loader_failed(self, loader: ContextLoader, error: BaseException):
+        logger.warning(
+            "Context loader %s of %s failed",
+            loader.name,
+            self.__class__.__name__,
+            exc_info=error,
+        )
+        self.context_loader_errors[loader.name] = error
+        return loader.default
@@ -0,0 +1,140 @@
+import csv
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Sequence
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+from .admin_base_view import AdminBaseView
+
+if TYPE_CHECKING:
+    from django.db.models import Model, QuerySet
+
+CSV_EXPORT = "csv"
+JSON_EXPORT = "json"
+
+CONTENT_TYPES = {
+    CSV_EXPORT: "text/csv",
+    JSON_EXPORT: "application/json",
+}
+
+
+class Echo:
+    "file-like object that returns what is written instead of buffering it"
+
+    def write(self, value: str) -> str:
+        return value
+
+
+class AdminExportView(AdminBaseView):
+    """
+    Base class for custom admin views that stream a queryset as a CSV or JSON file.
+    Rows are read from the database chunk_size at a time, so memory use doesn't grow
+    with the number of rows.
+
+
+    :cvar model:
+        Model to export, used if get_queryset is not overridden
+
+        :type: Model or none
+        :default: none
+
+    :cvar export_format:
+        ``"csv"`` or ``"json"``
+
+        :type: str
+        :default: "csv"
+
+    :cvar export_fields:
+        Field names to export, passed to queryset.values_list(). Defaults to all concrete fields.
+
+        :type: tuple[str]
+        :default: ()
+
+    :cvar chunk_size:
+        Number of rows fetched from the database and sent to the client at a time
+
+        :type: int
+        :default: 2000
+
+    :cvar filename:
+        Name of the downloaded file without extension, defaults to route_name
+
+        :type: str or none
+        :default: none
+    """
+
+    model: Optional["Model"] = None
+    export_format: str = CSV_EXPORT
+    export_fields: Sequence[str] = ()
+    chunk_size: int = 2000
+    filename: Optional[str] = None
+
+    def get(self, request, *args, **kwargs):
+        if self.export_format not in CONTENT_TYPES:
+            raise ImproperlyConfigured(
+                f"{self.__class__.__name__}.export_format must be '{CSV_EXPORT}' or '{JSON_EXPORT}'"
+            )
+
+        fields = self.get_export_fields()
+        rows = self.get_export_rows(fields)
+        if self.export_format == CSV_EXPORT:
+            content = self.stream_csv(fields, rows)
+        else:
+            content = self.stream_json(fields, rows)
+
+        response = StreamingHttpResponse(
+            content, content_type=CONTENT_TYPES[self.export_format]
+        )
+        response[
+            "Content-Disposition"
+        ] = f'attachment; filename="{self.get_filename()}.{self.export_format}"'
+        return response
+
+    def get_queryset(self) -> "QuerySet":
+        if self.model is None:
+            raise ImproperlyConfigured(
+                f"{self.__class__.__name__} is missing a model. Define {self.__class__.__name__}.model or override {self.__class__.__name__}.get_queryset()."
+            )
+        return self.model._default_manager.all()  # pylint: disable=protected-access
+
+    def get_export_fields(self) -> Sequence[str]:
+        if self.export_fields:
+            return tuple(self.export_fields)
+        return tuple(
+            field.attname for field in self.get_queryset().model._meta.concrete_fields
+        )
+
+    def get_filename(self) -> str:
+        return self.filename or self.route_name
+
+    def get_export_rows(self, fields: Sequence[str]) -> Iterator[Sequence]:
+        "yields the exported values of each row, override get_export_row to change them"
+        queryset = self.get_queryset().values_list(*fields)
+        for row in queryset.iterator(chunk_size=self.chunk_size):
+            yield self.get_export_row(row)
+
+    def get_export_row(self, row: Sequence) -> Sequence:
+        return row
+
+    def _chunks(self, lines: Iterable[str]) -> Iterator[str]:
+        "joins lines so each written chunk holds up to chunk_size rows"
+        lines = iter(lines)
+        while chunk := "".join(islice(lines, self.chunk_size)):
+            yield chunk
+
+    def stream_csv(self, fields: Sequence[str], rows: Iterable[Sequence]):
+        writer = csv.writer(Echo())
+        yield writer.writerow(fields)
+        yield from self._chunks(writer.writerow(row) for row in rows)
+
+    def stream_json(self, fields: Sequence[str], rows: Iterable[Sequence]):
+        encoder = DjangoJSONEncoder()
+        lines = (
+            ("\n" if i == 0 else ",\n") + encoder.encode(dict(zip(fields, row)))
+            for i, row in enumerate(rows)
+        )
+        yield "["
+        yield from self._chunks(lines)
+        yield "\n]\n"
@@ -0,0 +1,130 @@
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
+
+from django.contrib import admin
+from django.core.exceptions import ImproperlyConfigured
+from django.http import Http404, JsonResponse
+from django.shortcuts import redirect
+from django.urls import reverse
+from django.views.generic import TemplateView
+
+from ..jobs import PENDING, RUNNING, get_job_status, submit_job
+from .admin_base_view import AdminBaseView
+
+
+class AdminJobStatusView(AdminBaseView, TemplateView):
+    """
+    Shows the progress of a job started by job_view. Generated and registered for
+    every registered AdminJobView. Add ``?format=json`` to get the status as json,
+    which requires job results to be JSON serializable.
+    """
+
+    show_in_menu = False
+    job_view: Optional[Type["AdminJobView"]] = None
+    refresh_interval: int = 2
+
+    def user_has_permission(self, user):
+        if self.job_view is None:
+            raise ImproperlyConfigured(
+                f"{self.__class__.__name__} is missing a job_view. Status views are generated by AdminJobView.get_status_view()."
+            )
+        return self.job_view.user_has_class_permission(user)
+
+    def get(self, request, *args, **kwargs):
+        self.job = get_job_status(kwargs["job_id"])
+        if self.job is None:
+            raise Http404("Job not found")
+        if request.GET.get("format") == "json":
+            return JsonResponse(self.job._asdict())
+        return super().get(request, *args, **kwargs)
+
+    def get_context_data(self, *args, **kwargs):
+        context = super().get_context_data(*args, **kwargs)
+        context.update(
+            {
+                "title": self.job_view.view_name,
+                "job": self.job,
+                "job_running": self.job.state in (PENDING, RUNNING),
+                "refresh_interval": self.refresh_interval,
+            }
+        )
+        return context
+
+
+class AdminJobView(AdminBaseView, TemplateView):
+    """
+    Base class for custom admin views that start a long running job. GET renders
+    template_name, POST submits job_function to the job executor and redirects to a
+    status page, which is registered together with the view.
+
+
+    :cvar job_function:
+        Function or dotted path of the function to run. It's called with a JobProgress, followed by the
+        arguments from get_job_arguments.
+
+        :type: callable or str
+        :default: none
+
+    :cvar status_template_name:
+        Template of the status page
+
+        :type: str
+        :default: "admin_job_status.html"
+    """
+
+    template_name = "admin_job.html"
+    status_template_name = "admin_job_status.html"
+    job_function: Optional[Union[str, Callable]] = None
+
+    def post(self, request, *args, **kwargs):
+        job_args, job_kwargs = self.get_job_arguments()
+        job_id = submit_job(self.get_job_function(), *job_args, **job_kwargs)
+        return redirect(self.get_status_url(job_id))
+
+    def get_context_data(self, *args, **kwargs):
+        context = super().get_context_data(*args, **kwargs)
+        context["title"] = self.view_name
+        return context
+
+    def get_job_function(self) -> Union[str, Callable]:
+        if self.job_function is None:
+            raise ImproperlyConfigured(
+                f"{self.__class__.__name__} is missing a job_function. Define {self.__class__.__name__}.job_function or override {self.__class__.__name__}.get_job_function()."
+            )
+        # functions set on the class are bound to the instance
+        return getattr(self.job_function, "__func__", self.job_function)
+
+    def get_job_arguments(self) -> Tuple[tuple, Dict[str, Any]]:
+        """
+        Override to return the positional and keyword arguments of the job, e.g. from
+        a submitted form. They must be picklable to run on another process.
+        """
+        return (), {}
+
+    def get_status_url(self, job_id: str) -> str:
+        return reverse(
+            f"{admin.site.name}:{self.get_status_view().route_name}",
+            kwargs={"job_id": job_id},
+        )
+
+    @classmethod
+    def get_status_view(cls) -> Type[AdminJobStatusView]:
+        "returns the status view of this job view, created once per class"
+        if "_status_view" not in cls.__dict__:
+            cls._status_view = type(
+                f"{cls.__name__}Status",
+                (AdminJobStatusView,),
+                {
+                    "__module__": cls.__module__,
+                    "view_name": f"{cls.view_name} status",
+                    "route_name": f"{cls.route_name}_status",
+                    "route_path": f"{cls.route_path.rstrip('/')}/<str:job_id>/",
+                    "app_label": cls.app_label,
+                    "template_name": cls.status_template_name,
+                    "job_view": cls,
+                },
+            )
+        return cls._status_view
+
+    @classmethod
+    def get_extra_views(cls):
+        return (cls.get_status_view(),)
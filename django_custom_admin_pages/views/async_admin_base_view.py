@@ -0,0 +1,148 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict
+
+from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.utils.cache import add_never_cache_headers, get_conditional_response
+from django.views.generic.base import ContextMixin, TemplateResponseMixin
+
+from asgiref.sync import sync_to_async
+
+from ..app_settings import app_settings
+from ..instrumentation import DISPATCH, PERMISSION, Measurement, measure
+from .admin_base_view import NEVER_CACHE, AdminBaseView, ContextLoader
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractBaseUser
+    from django.http import HttpRequest
+
+
+class AsyncAdminBaseView(AdminBaseView):
+    """
+    Base class for async custom admin views, for use under ASGI. Handlers must be
+    defined with ``async def``. Requires Django 4.1+.
+
+    The user is loaded and permissions are checked without blocking the event loop.
+    Synchronous hooks (get_etag, get_last_modified, get_context_data) run in a thread,
+    use aget_context_data() to build the context from an async handler.
+    """
+
+    # View.dispatch is sync, Django dispatches async views by awaiting it
+    async def dispatch(  # pylint: disable=invalid-overridden-method
+        self, request, *args, **kwargs
+    ):
+        if not app_settings.CUSTOM_ADMIN_INSTRUMENTATION:
+            return await self._adispatch(request, *args, **kwargs)
+
+        # queries made in other threads can't be counted
+        measurement = Measurement(
+            DISPATCH, self.route_name, count_queries=False
+        ).start()
+        try:
+            response = await self._adispatch(request, *args, **kwargs)
+        except BaseException:
+            measurement.stop()
+            raise
+        return self._stop_after_render(measurement, response)
+
+    async def _adispatch(self, request, *args, **kwargs):
+        request.user = await self._aget_user(request)
+        with measure(PERMISSION, self.route_name, count_queries=False):
+            has_permission = await self.ahas_permission()
+        if not has_permission:
+            return self._permission_denied()
+
+        if self.cache_policy == NEVER_CACHE:
+            response = await super(PermissionRequiredMixin, self).dispatch(
+                request, *args, **kwargs
+            )
+            add_never_cache_headers(response)
+            return response
+
+        self._check_cache_policy()
+        etag, last_modified = await sync_to_async(self._get_validators)(
+            request, *args, **kwargs
+        )
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = await super(PermissionRequiredMixin, self).dispatch(
+                request, *args, **kwargs
+            )
+        return self._add_cache_headers(request, response, etag, last_modified)
+
+    @staticmethod
+    async def _aget_user(request: "HttpRequest") -> "AbstractBaseUser":
+        "loads the lazy request.user outside of the event loop"
+        if hasattr(request, "auser"):
+            return await request.auser()
+
+        def get_user():
+            user = request.user
+            _ = user.is_authenticated  # evaluates the lazy object
+            return user
+
+        return await sync_to_async(get_user)()
+
+    async def ahas_permission(self) -> bool:
+        return await self.auser_has_permission(self.request.user)
+
+    async def auser_has_permission(self, user: "AbstractBaseUser") -> bool:
+        """
+        Async version of user_has_permission, uses user.ahas_perms() where available.
+        """
+        if type(self).user_has_permission is not AdminBaseView.user_has_permission:
+            return await sync_to_async(self.user_has_permission)(user)
+
+        perms = self.get_permission_required()
+        has_permission = self._check_user_status(user, perms)
+        if has_permission is not None:
+            return has_permission
+        if hasattr(user, "ahas_perms"):
+            return await user.ahas_perms(perms)
+        return await sync_to_async(user.has_perms)(perms)
+
+    async def aget_context_data(self, **kwargs) -> dict:
+        """
+        Async version of get_context_data, runs context_loaders with aload_context and
+        builds the admin site context in a thread.
+        """
+        if self.context_loaders and self.loaded_context is None:
+            self.loaded_context = await self.aload_context()
+        return await sync_to_async(self.get_context_data)(**kwargs)
+
+    async def aload_context(self) -> Dict[str, Any]:
+        """
+        Async version of load_context, runs context_loaders with asyncio.gather.
+        Loaders may be coroutine methods, others are run in threads.
+        """
+        self.context_loader_errors = {}
+        loaders = list(self.context_loaders)
+        results = await asyncio.gather(
+            *(self._arun_context_loader(loader) for loader in loaders)
+        )
+        return {loader.name: result for loader, result in zip(loaders, results)}
+
+    async def _arun_context_loader(self, loader: ContextLoader):
+        method = getattr(self, loader.method)
+        if asyncio.iscoroutinefunction(method):
+            awaitable = method()
+        else:
+            # sync_to_async runs the loader in a copy of the current context
+            awaitable = sync_to_async(self._run_context_loader, thread_sensitive=False)(
+                loader
+            )
+        try:
+            return await asyncio.wait_for(awaitable, loader.timeout)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            return self._context_loader_failed(loader, e)
+
+
+class AsyncAdminTemplateView(AsyncAdminBaseView, TemplateResponseMixin, ContextMixin):
+    """
+    Async custom admin view that renders template_name with the admin site context.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        context = await self.aget_context_data(**kwargs)
+        return self.render_to_response(context)
@@ -0,0 +1,89 @@
+from typing import Optional, Type
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+from asgiref.sync import async_to_sync
+
+from .admin_base_view import AdminBaseView
+
+
+class LazyAdminView(AdminBaseView):
+    """
+    Stands in for the view at view_path, which is only imported when the view is first
+    dispatched. The menu and urls are built from the attributes of the stand-in, so it
+    has to declare the view_name, app_label, route and permission_required of the view.
+    The imported view is dispatched with the stand-in's view_name, app_label and route,
+    and requests are permission checked by it. Views with extra views, such as
+    AdminJobView, can't be registered lazily because the urls of their extra views
+    would only be known once they're imported. Created by
+    CustomAdminSite.register_lazy_view.
+    """
+
+    view_path: Optional[str] = None
+    _view: Optional[Type[AdminBaseView]] = None
+
+    @classmethod
+    def get_view(cls) -> Type[AdminBaseView]:
+        "imports the view at view_path"
+        if cls._view is None:
+            view = import_string(cls.view_path)
+            if not (isinstance(view, type) and issubclass(view, AdminBaseView)):
+                raise ImproperlyConfigured(
+                    f"{cls.view_path} must be a class-based view inheriting from AdminBaseView"
+                )
+            if (
+                view.get_extra_views.__func__
+                is not AdminBaseView.get_extra_views.__func__
+            ):
+                raise ImproperlyConfigured(
+                    f"{cls.view_path} has extra views and can't be registered lazily, register it with register_view instead."
+                )
+            cls._view = view
+        return cls._view
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view_func = None
+
+        def view(request, *args, **kwargs):
+            nonlocal view_func
+            if view_func is None:
+                view_class = cls.get_view()
+                view_func = view_class.as_view(
+                    view_name=cls.view_name,
+                    app_label=cls.app_label,
+                    route_name=cls.route_name,
+                    route_path=cls.route_path,
+                    **initkwargs,
+                )
+                if getattr(view_class, "view_is_async", False):
+                    view_func = async_to_sync(view_func)
+            return view_func(request, *args, **kwargs)
+
+        view.view_class = cls
+        view.view_initkwargs = initkwargs
+        return view
+
+
+def make_lazy_view(  # pylint: disable=too-many-arguments
+    view_path: str,
+    view_name: str,
+    app_label: Optional[str] = None,
+    route_name: Optional[str] = None,
+    route_path: Optional[str] = None,
+    permission_required=(),
+) -> Type[LazyAdminView]:
+    return type(
+        f"Lazy{view_path.rsplit('.', 1)[-1]}",
+        (LazyAdminView,),
+        {
+            "__module__": __name__,
+            "view_path": view_path,
+            "view_name": view_name,
+            "app_label": app_label,
+            "route_name": route_name,
+            "route_path": route_path,
+            "permission_required": permission_required,
+        },
+    )
@@ -0,0 +1,27 @@
+from django.views.generic import TemplateView
+
+from ..instrumentation import MemorySink, get_sinks
+from .admin_base_view import AdminBaseView
+
+
+class PerformanceView(AdminBaseView, TemplateView):
+    """
+    Shows the timings collected by the MemorySink of this process. Only visible to
+    superusers. Registered on every CustomAdminSite if CUSTOM_ADMIN_INSTRUMENTATION
+    is on.
+    """
+
+    view_name = "Custom admin performance"
+    route_name = "custom_admin_performance"
+    template_name = "admin_performance.html"
+
+    def user_has_permission(self, user):
+        return user.is_active and user.is_superuser
+
+    def get_context_data(self, *args, **kwargs):
+        context = super().get_context_data(*args, **kwargs)
+        sinks = [sink for sink in get_sinks() if isinstance(sink, MemorySink)]
+        context["title"] = self.view_name
+        context["has_memory_sink"] = bool(sinks)
+        context["stats"] = sinks[0].get_stats() if sinks else []
+        return context
@@ -0,0 +1,13 @@
+from django.contrib import admin
+from django.views.generic import TemplateView
+
+from django_custom_admin_pages.views.admin_base_view import AdminBaseView
+
+
+class DiscoveredView(AdminBaseView, TemplateView):
+    view_name = "Discovered View"
+    app_label = "test_app"
+    template_name = "base_custom_admin.html"
+
+
+admin.site.register_view(DiscoveredView)